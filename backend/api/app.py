@@ -2,14 +2,31 @@ from pathlib import Path
 import sys
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 import time
+import asyncio
+import importlib.util
 sys.path.append('..')
 import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from config.db import get_universities_collection
-from datetime import datetime
-from typing import Optional, Dict, Any
+from fastapi.responses import StreamingResponse, JSONResponse
+
+# orjson serializes several times faster than the standard library
+if importlib.util.find_spec("orjson"):
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+else:
+    DefaultResponse = JSONResponse
+from config.db import get_universities_collection, get_deadlines_collection, ensure_indexes
+from config.async_db import get_async_universities_collection, get_async_deadlines_collection
+from config.settings import (
+    SEARCH_BACKEND, RESULT_CACHE_SIZE, RESULT_CACHE_TTL,
+    EVENTS_POLL_SECONDS, EVENTS_KEEPALIVE_SECONDS,
+    UNIVERSITY_CACHE_SIZE, UNIVERSITY_CACHE_PREWARM,
+    HTTP_CACHE_MAX_AGE, COMPRESSION_MIN_SIZE,
+    COMPARE_MAX_UNIVERSITIES
+)
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List
 import subprocess
 import os
 import re
@@ -17,10 +34,80 @@ from pydantic import BaseModel
 
 # Import calculators from utils
 from utils.aggregate_calc import UNIVERSITY_CALCULATORS
+from utils.search_index import SearchIndex, FUZZY_THRESHOLD, tokenize
+from utils.suggest import SuggestIndex, MAX_SUGGESTIONS
+from utils.mongo_search import ensure_text_index, mongo_search
+from utils.generation import bump_generation, get_generation_info_async, current_generation_async
+from utils.cache import ResultCache
+from utils.deadline_dates import normalize_deadline
+from utils.ingest import backfill_deadline_dates, backfill_university_fields, INTERNAL_FIELDS
+from utils.summary import summary_of, next_deadline
+from utils.lookup import lookup_key
+from utils.university_cache import UniversityCache, project_document
+from utils.ics import render_calendar
+from utils.http_cache import make_etag, http_date, is_not_modified
+from utils.events import EventHub, format_event, deadline_digests
+from utils.compression import CompressionMiddleware
+
+app = FastAPI(title="University Guide API", version="1.0.0", default_response_class=DefaultResponse)
+
+# ============ CONDITIONAL GET ============
+
+# Read endpoints whose response depends only on the data generation, today's date and the URL
+CONDITIONAL_GET_PATHS = (
+    "/api/universities",
+    "/api/university/",
+    "/api/deadlines",
+    "/api/compare",
+    "/api/cities",
+    "/api/cities/",
+    "/api/aggregate/universities",
+)
+# Changes with every deploy, so cached responses from older code are not reused
+DEPLOY_TOKEN = os.getenv("RENDER_GIT_COMMIT", app.version)
+
+def uses_conditional_get(request):
+    path = request.url.path
+    if request.method not in ("GET", "HEAD") or path.endswith(".ics"):
+        return False
+    return any(path == p or (p.endswith("/") and path.startswith(p)) for p in CONDITIONAL_GET_PATHS)
+
+@app.middleware("http")
+async def conditional_get(request, call_next):
+    """ETag / Last-Modified / Cache-Control for read endpoints, answering 304 without running them"""
+    if not uses_conditional_get(request):
+        return await call_next(request)
+    
+    info = await get_generation_info_async()
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    etag = make_etag(
+        DEPLOY_TOKEN, info["value"], today.date().isoformat(),
+        request.url.path, request.url.query
+    )
+    # Responses also change at midnight (is_past), so never claim to be older than today
+    last_modified = today.astimezone(timezone.utc)
+    if info["updated_at"]:
+        updated_at = info["updated_at"]
+        if updated_at.tzinfo is None:
+            updated_at = updated_at.replace(tzinfo=timezone.utc)
+        last_modified = max(last_modified, updated_at)
+    
+    headers = {
+        "ETag": etag,
+        "Last-Modified": http_date(last_modified),
+        "Cache-Control": f"public, max-age={HTTP_CACHE_MAX_AGE}, must-revalidate"
+    }
+    if is_not_modified(request.headers, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+    
+    response = await call_next(request)
+    if response.status_code == 200:
+        response.headers.update(headers)
+    return response
 
-app = FastAPI(title="University Guide API", version="1.0.0")
+app.add_middleware(CompressionMiddleware, minimum_size=COMPRESSION_MIN_SIZE, excluded_paths=["/api/events"])
 
-# CORS
+# CORS is added last so it wraps everything, including 304s from conditional_get
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -44,52 +131,235 @@ class AggregateRequest(BaseModel):
 
 # ============ HELPER FUNCTIONS ============
 
-def parse_deadline_date(date_str):
-    """Parse various date formats and return a datetime object."""
-    if not date_str or not isinstance(date_str, str):
+search_index = SearchIndex()
+suggest_index = SuggestIndex()
+indexed_generation = None
+index_lock = asyncio.Lock()
+
+# Cached responses of /api/search and /api/deadlines, invalidated by the data generation
+result_cache = ResultCache(maxsize=RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL)
+
+# Decoded university documents, read through from MongoDB
+university_cache = UniversityCache(maxsize=UNIVERSITY_CACHE_SIZE)
+
+# Fields the compare and city views read; summary replaces the embedded arrays
+SUMMARY_PROJECTION = {"name": 1, "full_name": 1, "city": 1, "address": 1, "website": 1, "summary": 1}
+
+async def find_university(name):
+    """University document by any of its names, from the in-process cache when possible"""
+    collection = get_async_universities_collection()
+    if not university_cache.enabled:
+        uni = await collection.find_one(university_query(name))
+        if uni:
+            uni["_id"] = str(uni["_id"])
+        return uni
+    return await university_cache.get(await current_generation_async(), name, collection.find_one)
+
+async def find_universities(names, projection=None):
+    """{lookup key: university} for every name that exists, fetched with one $in query
+
+    Cached documents are served whole; projection only applies to what is
+    read from MongoDB.
+    """
+    collection = get_async_universities_collection()
+    if university_cache.enabled:
+        return await university_cache.get_many(
+            await current_generation_async(), names, lambda query: collection.find(query).to_list()
+        )
+    keys = list(dict.fromkeys(lookup_key(name) for name in names))
+    if projection is not None:
+        projection = dict(projection, lookup_keys=1)
+    found = {}
+    async for uni in collection.find({"lookup_keys": {"$in": keys}}, projection):
+        uni["_id"] = str(uni["_id"])
+        for key in uni.get("lookup_keys", []):
+            if key in keys:
+                found[key] = uni
+    return found
+
+async def all_universities_cached():
+    """Every university document from a warmed cache, or None when the cache isn't warm"""
+    if not (university_cache.enabled and UNIVERSITY_CACHE_PREWARM):
         return None
+    generation = await current_generation_async()
+    documents = university_cache.all(generation)
+    if documents is None:
+        university_cache.warm(generation, await get_async_universities_collection().find().to_list())
+        documents = university_cache.all(generation)
+    return documents
+
+def university_query(name):
+    """Indexed equality match on any of a university's names or aliases"""
+    return {"lookup_keys": lookup_key(name)}
+
+async def university_names_matching(query):
+    """Every name the universities matching query are stored under
+
+    Standalone deadlines use either the short or the full university name.
+    """
+    names = set()
+    async for uni in get_async_universities_collection().find(query, {"name": 1, "full_name": 1}):
+        names.update(n for n in (uni.get("name"), uni.get("full_name")) if n)
+    return names
+
+def parsed_deadlines(uni):
+    """Embedded deadlines of a university document that have a parsed date"""
+    for deadline in uni.get("deadlines", []):
+        # Scrapers store the parsed date at ingest; only older documents need parsing here
+        if "deadline_parse_status" not in deadline:
+            deadline = normalize_deadline(dict(deadline))
+        if deadline["deadline_parse_status"] == "parsed":
+            yield dict(deadline, university_name=uni.get("name", "Unknown"), url=uni.get("admission_link", ""))
+
+async def calendar_response(request, cache_key, calendar_name, load_deadlines):
+    """Serve an iCalendar feed rendered once per data generation, honouring ETag/Last-Modified"""
+    info = await get_generation_info_async()
     
-    date_str = date_str.strip()
-    
-    # Remove weekday names
-    date_str = re.sub(
-        r'^(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s*',
-        '',
-        date_str,
-        flags=re.IGNORECASE
-    )
-    
-    formats = [
-        "%B %d, %Y", "%b %d, %Y", "%d-%m-%Y", "%d/%m/%Y",
-        "%Y-%m-%d", "%m/%d/%Y", "%d %B %Y", "%d %b %Y",
-    ]
+    async def render():
+        deadlines = sorted(await load_deadlines(), key=lambda d: d["deadline_iso"])
+        # DTSTAMP is the data's timestamp so the bytes (and ETag) only change with the data
+        body = render_calendar(calendar_name, deadlines, stamp=info["updated_at"])
+        return body, make_etag(body)
     
-    # Try extracting date range
-    range_pattern = r'([A-Za-z]+)\s+(\d{1,2})\s*-\s*(\d{1,2}),?\s*(\d{4})'
-    range_match = re.search(range_pattern, date_str)
-    if range_match:
-        month, day1, day2, year = range_match.groups()
-        date_str = f"{month} {day2}, {year}"
+    body, etag = await result_cache.get_or_compute_async(info["value"], cache_key, render)
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=3600"}
+    if info["updated_at"]:
+        headers["Last-Modified"] = http_date(info["updated_at"])
+    if is_not_modified(request.headers, etag, info["updated_at"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="text/calendar; charset=utf-8", headers=headers)
+
+def build_indexes(generation, documents):
+    global indexed_generation
+    search_index.build(documents, generation)
+    suggest_index.build(documents)
+    indexed_generation = generation
+
+async def load_and_build_indexes(generation):
+    """Read every university and build the indexes for generation (call with index_lock held)
+
+    Documents are read sorted by _id so every worker building the same
+    generation assigns the same positions, which search cursors rely on.
+    """
+    documents = await get_async_universities_collection().find().sort("_id", 1).to_list()
+    # Building is CPU-bound, so it runs off the event loop
+    await asyncio.to_thread(build_indexes, generation, documents)
+
+async def rebuild_indexes():
+    """Rebuild the in-memory search and autocomplete indexes from the universities collection"""
+    async with index_lock:
+        await load_and_build_indexes(await current_generation_async())
+
+async def ensure_indexes_current():
+    """Rebuild the in-memory indexes if a scraper has written new data since the last build"""
+    generation = await current_generation_async()
+    if indexed_generation is None or indexed_generation != generation:
+        async with index_lock:
+            # Another request may have rebuilt them while this one waited
+            if indexed_generation is None or indexed_generation != generation:
+                await load_and_build_indexes(generation)
+
+async def get_search_index():
+    """Return the search index, building it from the universities collection when stale"""
+    await ensure_indexes_current()
+    return search_index
+
+async def get_suggest_index():
+    """Return the autocomplete index, building it when stale"""
+    await ensure_indexes_current()
+    return suggest_index
+
+# ============ API ENDPOINTS ============
+
+@app.on_event("startup")
+async def create_indexes():
+    # One-off maintenance with the sync client, before requests are served
+    def prepare_collections():
+        backfill_university_fields(get_universities_collection())
+        ensure_indexes()
+        backfill_deadline_dates(get_deadlines_collection())
+        if SEARCH_BACKEND == "mongo":
+            ensure_text_index(get_universities_collection())
     
-    for fmt in formats:
+    await asyncio.to_thread(prepare_collections)
+    await all_universities_cached()
+
+# ============ CHANGE EVENTS ============
+
+event_hub = EventHub()
+latest_generation = {"value": None}
+
+async def load_deadline_digests():
+    return deadline_digests(await get_async_universities_collection().find({}, {"name": 1, "deadlines": 1}).to_list())
+
+async def watch_generation():
+    """Publish an event whenever scrapers write new data
+
+    One watcher serves every /api/events client. A generation change is
+    always announced; universities whose deadlines differ also get a
+    "deadlines" event so pages can refetch only what changed.
+    """
+    digests = None
+    while True:
         try:
-            return datetime.strptime(date_str, fmt)
-        except ValueError:
-            continue
+            info = await get_generation_info_async()
+            previous = latest_generation["value"]
+            if previous is None:
+                digests = await load_deadline_digests()
+            elif info["value"] != previous:
+                # Load before publishing: if this fails, the next poll retries without repeating events
+                new_digests = await load_deadline_digests()
+                event_hub.publish(format_event("generation", {
+                    "generation": info["value"],
+                    "source": info["source"],
+                    "updated_at": info["updated_at"]
+                }, event_id=info["value"]))
+                
+                for university in sorted(set(digests) | set(new_digests)):
+                    if digests.get(university) != new_digests.get(university):
+                        if university not in digests:
+                            change = "added"
+                        elif university not in new_digests:
+                            change = "removed"
+                        else:
+                            change = "changed"
+                        event_hub.publish(format_event("deadlines", {
+                            "university": university,
+                            "change": change
+                        }, event_id=info["value"]))
+                digests = new_digests
+            latest_generation["value"] = info["value"]
+        except Exception as e:
+            print(f"Event watcher error: {e}")
+        await asyncio.sleep(EVENTS_POLL_SECONDS)
+
+@app.on_event("startup")
+async def start_event_watcher():
+    asyncio.create_task(watch_generation())
+
+@app.get("/api/events")
+async def events(request: Request):
+    """Server-Sent Events stream of data changes ("generation" and "deadlines" events)"""
+    queue = event_hub.subscribe()
     
-    # Try extracting "Month Day, Year"
-    month_day_year = r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s*(\d{4})'
-    match = re.search(month_day_year, date_str, re.IGNORECASE)
-    if match:
+    async def stream():
         try:
-            extracted = f"{match.group(1)} {match.group(2)}, {match.group(3)}"
-            return datetime.strptime(extracted, "%B %d, %Y")
-        except ValueError:
-            pass
+            # Tell the client where it stands, so a reconnect after missed events can catch up
+            current = latest_generation["value"]
+            if current is not None:
+                yield format_event("generation", {"generation": current}, event_id=current)
+            while not await request.is_disconnected():
+                try:
+                    yield await asyncio.wait_for(queue.get(), timeout=EVENTS_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+        finally:
+            event_hub.unsubscribe(queue)
     
-    return None
-
-# ============ API ENDPOINTS ============
+    return StreamingResponse(stream(), media_type="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"
+    })
 
 @app.get("/")
 async def root():
@@ -99,6 +369,22 @@ async def root():
 async def health():
     return {"status": "healthy"}
 
+@app.get("/api/generation")
+async def generation():
+    """Current data generation, so clients can tell whether a static snapshot is current"""
+    return await get_generation_info_async()
+
+@app.get("/api/cache/stats")
+async def cache_stats():
+    """Data generation and hit/miss statistics of the result cache"""
+    return {
+        "generation": await get_generation_info_async(),
+        "caches": {
+            "results": result_cache.stats(),
+            "universities": university_cache.stats()
+        }
+    }
+
 # ============ SCRAPER ENDPOINT ============
 
 @app.post("/api/scrape-all")
@@ -113,7 +399,9 @@ async def scrape_all_universities():
                 "message": f"Scraper not found at {scraper_path}"
             }
         
-        result = subprocess.run(
+        # Run in a worker thread so the scrape doesn't stall other requests
+        result = await asyncio.to_thread(
+            subprocess.run,
             [sys.executable, str(scraper_path)],
             capture_output=True,
             text=True,
@@ -121,6 +409,10 @@ async def scrape_all_universities():
             env={**os.environ, "PYTHONIOENCODING": "utf-8"}
         )
         
+        # Scraped data changed: invalidate cached results and rebuild the search indexes
+        await asyncio.to_thread(bump_generation, "scrape-all")
+        await rebuild_indexes()
+        
         return {
             "status": "success",
             "message": "All scrapers completed",
@@ -187,12 +479,12 @@ def calculate_aggregate(request: AggregateRequest):
 # ============ UNIVERSITY DATA ENDPOINTS ============
 
 @app.get("/api/universities")
-def get_all_universities():
+async def get_all_universities():
     """Get all universities for homepage"""
-    collection = get_universities_collection()
+    collection = get_async_universities_collection()
     universities = []
 
-    for uni in collection.find({}, {"name": 1, "full_name": 1, "city": 1}):
+    async for uni in collection.find({}, {"name": 1, "full_name": 1, "city": 1}):
         universities.append({
             "name": uni.get("name", "Unknown"),
             "full_name": uni.get("full_name", ""),
@@ -201,40 +493,146 @@ def get_all_universities():
 
     return universities
 
+# Keeps the ingest-only fields out of university detail responses
+INTERNAL_EXCLUSION = {field: 0 for field in INTERNAL_FIELDS}
+
+FIELD_PATH_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*$")
+
+def parse_fields(fields):
+    """Turn "name,programs.name" into a MongoDB inclusion projection"""
+    projection = {}
+    for field in fields.split(","):
+        field = field.strip()
+        if not field:
+            continue
+        if not FIELD_PATH_RE.match(field) or field.split(".")[0] in INTERNAL_FIELDS:
+            raise HTTPException(status_code=400, detail=f"Invalid field '{field}'")
+        projection[field] = 1
+    # MongoDB rejects a path alongside one of its own sub-paths ("programs,programs.name")
+    for field in projection:
+        for other in projection:
+            if other.startswith(field + "."):
+                raise HTTPException(status_code=400, detail=f"Field '{other}' overlaps '{field}'")
+    return projection
+
 @app.get("/api/university/{name}")
-def get_university(name: str):
-    """Get single university details"""
-    collection = get_universities_collection()
-
-    uni = collection.find_one({
-        "$or": [
-            {"name": {"$regex": f"^{name}$", "$options": "i"}},
-            {"shortName": {"$regex": f"^{name}$", "$options": "i"}},
-            {"short_name": {"$regex": f"^{name}$", "$options": "i"}}
-        ]
-    })
+async def get_university(
+    name: str,
+    fields: Optional[str] = None,
+    programs_limit: Optional[int] = Query(None, ge=1),
+    programs_offset: int = Query(0, ge=0)
+):
+    """Get single university details
+
+    fields (e.g. "name,programs.name,programs.total_fee_first_year") limits
+    the returned fields, and programs_limit/programs_offset return a slice
+    of the programs array. Cached documents are cut down in memory,
+    otherwise both are applied inside MongoDB.
+    """
+    collection = get_async_universities_collection()
+    query = university_query(name)
+    projection = parse_fields(fields) if fields else None
+    
+    if university_cache.enabled:
+        uni = await find_university(name)
+        if not uni:
+            return {"error": "University not found"}
+        if programs_limit is not None or programs_offset:
+            programs = uni.get("programs") or []
+            end = programs_offset + programs_limit if programs_limit else None
+            uni = dict(uni, programs_total=len(programs), programs=programs[programs_offset:end])
+            if projection is not None:
+                projection["programs_total"] = 1
+        if projection is not None:
+            uni = project_document(uni, projection)
+        return uni
+    
+    if projection is None and programs_limit is None and not programs_offset:
+        uni = await collection.find_one(query, INTERNAL_EXCLUSION)
+    else:
+        pipeline = [{"$match": query}, {"$limit": 1}]
+        if programs_limit is not None or programs_offset:
+            programs = {"$ifNull": ["$programs", []]}
+            pipeline.append({"$set": {
+                "programs_total": {"$size": programs},
+                "programs": {"$slice": [programs, programs_offset, programs_limit or 2147483647]}
+            }})
+            if projection is not None:
+                projection["programs_total"] = 1
+        pipeline.append({"$project": projection if projection is not None else INTERNAL_EXCLUSION})
+        results = await (await collection.aggregate(pipeline)).to_list()
+        uni = results[0] if results else None
 
     if not uni:
         return {"error": "University not found"}
 
-    uni["_id"] = str(uni["_id"])
+    if "_id" in uni:
+        uni["_id"] = str(uni["_id"])
     return uni
 
+@app.get("/api/cities")
+async def get_cities():
+    """Every city with its university and program counts and first-year fee range
+
+    One $group over the stored summaries (no unwinding of programs),
+    cached until the data changes.
+    """
+    async def load_cities():
+        # A zero fee means the university lists no fees, so it is left out of the range
+        def known_fee(stat):
+            field = f"$summary.fee_range.{stat}"
+            return {"$cond": [{"$gt": [field, 0]}, field, None]}
+
+        pipeline = [
+            {"$match": {"city_key": {"$nin": [None, ""]}}},
+            {"$group": {
+                "_id": "$city_key",
+                "city": {"$first": "$city"},
+                "universities": {"$sum": 1},
+                "programs": {"$sum": {"$ifNull": ["$summary.program_count", 0]}},
+                "fee_min": {"$min": known_fee("min")},
+                "fee_max": {"$max": known_fee("max")}
+            }},
+            {"$sort": {"universities": -1, "_id": 1}},
+            {"$project": {
+                "_id": 0,
+                "city": 1,
+                "universities": 1,
+                "programs": 1,
+                "fee_range": {
+                    "min": {"$ifNull": ["$fee_min", 0]},
+                    "max": {"$ifNull": ["$fee_max", 0]}
+                }
+            }}
+        ]
+        cities = await (await get_async_universities_collection().aggregate(pipeline)).to_list()
+        return {"count": len(cities), "cities": cities}
+
+    return await result_cache.get_or_compute_async(await current_generation_async(), ("cities",), load_cities)
+
 @app.get("/api/cities/{city}")
-def get_universities_by_city(city: str):
+async def get_universities_by_city(city: str):
     """Get universities in a specific city"""
-    collection = get_universities_collection()
+    collection = get_async_universities_collection()
+    
+    documents = await all_universities_cached()
+    if documents is not None:
+        # Cached documents don't keep city_key
+        documents = [uni for uni in documents if lookup_key(uni.get("city") or "") == lookup_key(city)]
+    else:
+        documents = await collection.find({"city_key": lookup_key(city)}, SUMMARY_PROJECTION).to_list()
     
     universities = []
-    for uni in collection.find({"city": {"$regex": f"^{city}$", "$options": "i"}}):
+    for uni in documents:
+        summary = summary_of(uni)
         universities.append({
             "name": uni.get("name"),
             "full_name": uni.get("full_name"),
             "city": uni.get("city"),
             "address": uni.get("address", ""),
             "website": uni.get("website", ""),
-            "total_programs": len(uni.get("programs", [])),
-            "has_scholarships": len(uni.get("scholarships", [])) > 0
+            "total_programs": summary["program_count"],
+            "has_scholarships": summary["scholarship_count"] > 0
         })
     
     if not universities:
@@ -246,135 +644,198 @@ def get_universities_by_city(city: str):
         "universities": universities
     }
 
-@app.get("/api/compare")
-def compare_universities(uni1: str, uni2: str):
-    """Compare two universities"""
-    collection = get_universities_collection()
-    
-    university1 = collection.find_one({
-        "$or": [
-            {"name": {"$regex": f"^{uni1}$", "$options": "i"}},
-            {"shortName": {"$regex": f"^{uni1}$", "$options": "i"}}
+# Extra fields /api/compare reads for shared programs, and with details=true
+COMPARE_PROJECTION = dict(SUMMARY_PROJECTION, **{"programs.name": 1})
+COMPARE_DETAIL_PROJECTION = dict(COMPARE_PROJECTION, **{
+    "email": 1,
+    "programs.department": 1,
+    "programs.total_fee_first_year": 1,
+    "scholarships.name": 1,
+    "scholarships.type": 1
+})
+
+def compare_entry(uni, today, details=False):
+    summary = summary_of(uni)
+    entry = {
+        "name": uni.get("name"),
+        "full_name": uni.get("full_name"),
+        "city": uni.get("city"),
+        "address": uni.get("address", ""),
+        "website": uni.get("website", ""),
+        "total_programs": summary["program_count"],
+        "departments": summary["departments"],
+        "fee_range": summary["fee_range"],
+        "scholarships_count": summary["scholarship_count"],
+        "upcoming_deadlines": summary["deadline_count"],
+        "next_deadline": next_deadline(summary, today)
+    }
+    if details:
+        entry["email"] = uni.get("email", "")
+        entry["programs"] = [
+            {key: p.get(key) for key in ("name", "department", "total_fee_first_year")}
+            for p in uni.get("programs") or []
         ]
-    })
-    
-    university2 = collection.find_one({
-        "$or": [
-            {"name": {"$regex": f"^{uni2}$", "$options": "i"}},
-            {"shortName": {"$regex": f"^{uni2}$", "$options": "i"}}
+        entry["scholarships"] = [
+            {key: s.get(key) for key in ("name", "type")}
+            for s in uni.get("scholarships") or []
         ]
-    })
-    
-    if not university1:
-        return {"error": f"University '{uni1}' not found"}
-    if not university2:
-        return {"error": f"University '{uni2}' not found"}
-    
-    def get_fee_stats(programs):
-        fees = [p.get("total_fee_first_year") for p in programs if p.get("total_fee_first_year")]
-        if not fees:
-            return {"min": 0, "max": 0, "avg": 0}
+    return entry
+
+def comparison_matrix(entries, universities):
+    """Side-by-side rows for entries, one value per university in request order"""
+    fee_rows = {
+        f"fee_{stat}": [e["fee_range"].get(stat, 0) for e in entries]
+        for stat in ("min", "max", "avg", "median")
+    }
+    offered = [set(e["departments"]) for e in entries]
+    all_departments = sorted(set().union(*offered))
+
+    # Programs are matched by normalized name and labelled as the first university lists them
+    program_names = []
+    for uni in universities:
+        names = {}
+        for p in uni.get("programs") or []:
+            if p.get("name"):
+                names.setdefault(lookup_key(p["name"]), p["name"].strip())
+        program_names.append(names)
+    shared_keys = set(program_names[0]).intersection(*program_names[1:])
+
+    return {
+        "rows": dict(fee_rows, **{
+            "total_programs": [e["total_programs"] for e in entries],
+            "departments_count": [len(e["departments"]) for e in entries],
+            "scholarships_count": [e["scholarships_count"] for e in entries],
+            "deadlines_count": [e["upcoming_deadlines"] for e in entries]
+        }),
+        "departments": [
+            {"name": dept, "offered": [dept in depts for depts in offered]}
+            for dept in all_departments
+        ],
+        "shared_departments": [d for d in all_departments if all(d in depts for depts in offered)],
+        "shared_programs": sorted(program_names[0][key] for key in shared_keys)
+    }
+
+@app.get("/api/compare")
+async def compare_universities(
+    u: Optional[List[str]] = Query(None),
+    uni1: Optional[str] = None,
+    uni2: Optional[str] = None,
+    details: bool = False
+):
+    """Compare universities
+
+    Pass each university as u (?u=NUST&u=FAST&u=LUMS) to get them side by
+    side with an aligned comparison matrix, all fetched in one query. The
+    older uni1/uni2 form still returns the two-university response.
+    """
+    today = datetime.now().date().isoformat()
+    projection = COMPARE_DETAIL_PROJECTION if details else SUMMARY_PROJECTION
+
+    if not u:
+        if not (uni1 and uni2):
+            raise HTTPException(status_code=400, detail="Pass universities as u=...&u=... (or uni1 and uni2)")
+        found = await find_universities([uni1, uni2], projection)
+        university1 = found.get(lookup_key(uni1))
+        university2 = found.get(lookup_key(uni2))
+        if not university1:
+            return {"error": f"University '{uni1}' not found"}
+        if not university2:
+            return {"error": f"University '{uni2}' not found"}
         return {
-            "min": min(fees),
-            "max": max(fees),
-            "avg": round(sum(fees) / len(fees))
-        }
-    
-    def get_departments(programs):
-        depts = set()
-        for p in programs:
-            dept = p.get("department", "").strip()
-            if dept:
-                depts.add(dept)
-        return sorted(list(depts))
-    
-    comparison = {
-        "university1": {
-            "name": university1.get("name"),
-            "full_name": university1.get("full_name"),
-            "city": university1.get("city"),
-            "address": university1.get("address", ""),
-            "website": university1.get("website", ""),
-            "total_programs": len(university1.get("programs", [])),
-            "departments": get_departments(university1.get("programs", [])),
-            "fee_range": get_fee_stats(university1.get("programs", [])),
-            "scholarships_count": len(university1.get("scholarships", [])),
-            "upcoming_deadlines": len(university1.get("deadlines", []))
-        },
-        "university2": {
-            "name": university2.get("name"),
-            "full_name": university2.get("full_name"),
-            "city": university2.get("city"),
-            "address": university2.get("address", ""),
-            "website": university2.get("website", ""),
-            "total_programs": len(university2.get("programs", [])),
-            "departments": get_departments(university2.get("programs", [])),
-            "fee_range": get_fee_stats(university2.get("programs", [])),
-            "scholarships_count": len(university2.get("scholarships", [])),
-            "upcoming_deadlines": len(university2.get("deadlines", []))
+            "university1": compare_entry(university1, today, details),
+            "university2": compare_entry(university2, today, details)
         }
+
+    names = []
+    seen = set()
+    for name in u:
+        key = lookup_key(name)
+        if key and key not in seen:
+            seen.add(key)
+            names.append(name)
+    if len(names) < 2:
+        raise HTTPException(status_code=400, detail="Pass at least two different universities")
+    if len(names) > COMPARE_MAX_UNIVERSITIES:
+        raise HTTPException(status_code=400, detail=f"At most {COMPARE_MAX_UNIVERSITIES} universities can be compared")
+
+    found = await find_universities(names, COMPARE_DETAIL_PROJECTION if details else COMPARE_PROJECTION)
+    universities = []
+    resolved = set()
+    for name in names:
+        uni = found.get(lookup_key(name))
+        if not uni:
+            return {"error": f"University '{name}' not found"}
+        # Aliases such as "NUST" and "NUST Islamabad" resolve to the same university
+        if uni["_id"] not in resolved:
+            resolved.add(uni["_id"])
+            universities.append(uni)
+    if len(universities) < 2:
+        raise HTTPException(status_code=400, detail="Pass at least two different universities")
+
+    entries = [compare_entry(uni, today, details) for uni in universities]
+    return {
+        "count": len(entries),
+        "universities": entries,
+        "matrix": comparison_matrix(entries, universities)
     }
-    
-    return comparison
 
 @app.get("/api/search")
-def search_all(q: str):
-    """Search across universities, programs, and scholarships"""
+async def search_all(
+    q: str,
+    mode: str = "exact",
+    threshold: float = Query(FUZZY_THRESHOLD, ge=0.2, le=1),
+    universities_limit: int = Query(10, ge=0, le=100),
+    programs_limit: int = Query(30, ge=0, le=100),
+    scholarships_limit: int = Query(15, ge=0, le=100),
+    universities_cursor: Optional[str] = None,
+    programs_cursor: Optional[str] = None,
+    scholarships_cursor: Optional[str] = None
+):
+    """Search across universities, programs, and scholarships
+
+    mode=fuzzy tolerates typos by also matching words with similar trigrams;
+    threshold (0.2 to 1) is the trigram similarity a word must reach.
+    Each category is paged separately: pass the cursor returned in
+    "cursors" as <category>_cursor to get the next page.
+    SEARCH_BACKEND=mongo runs the search in MongoDB instead of in memory.
+    """
     if not q or len(q) < 2:
         return {"error": "Search query must be at least 2 characters", "results": []}
+    if mode not in ("exact", "fuzzy"):
+        raise HTTPException(status_code=400, detail="mode must be 'exact' or 'fuzzy'")
+    if mode == "fuzzy" and SEARCH_BACKEND == "mongo":
+        raise HTTPException(status_code=400, detail="Fuzzy search is not available with the mongo search backend")
     
-    collection = get_universities_collection()
-    query_lower = q.lower()
-    
-    results = {
-        "universities": [],
-        "programs": [],
-        "scholarships": [],
-        "total_results": 0
+    limits = {
+        "universities": universities_limit,
+        "programs": programs_limit,
+        "scholarships": scholarships_limit
+    }
+    cursors = {
+        "universities": universities_cursor,
+        "programs": programs_cursor,
+        "scholarships": scholarships_cursor
     }
     
-    for uni in collection.find():
-        uni_name = uni.get("name", "")
-        uni_full = uni.get("full_name", "")
-        
-        if query_lower in uni_name.lower() or query_lower in uni_full.lower():
-            results["universities"].append({
-                "name": uni_name,
-                "full_name": uni_full,
-                "city": uni.get("city"),
-                "type": "university"
-            })
-        
-        for program in uni.get("programs", []):
-            prog_name = program.get("name", "")
-            prog_dept = program.get("department", "")
-            
-            if query_lower in prog_name.lower() or query_lower in prog_dept.lower():
-                results["programs"].append({
-                    "name": prog_name,
-                    "department": prog_dept,
-                    "university": uni_name,
-                    "fee": program.get("total_fee_first_year"),
-                    "eligibility": program.get("eligibility", {}),
-                    "type": "program"
-                })
-        
-        for scholarship in uni.get("scholarships", []):
-            scholar_name = scholarship.get("name", "")
-            scholar_type = scholarship.get("type", "")
-            
-            if query_lower in scholar_name.lower() or query_lower in scholar_type.lower():
-                results["scholarships"].append({
-                    "name": scholar_name,
-                    "type": scholar_type,
-                    "university": uni_name,
-                    "link": scholarship.get("link", ""),
-                    "type_label": "scholarship"
-                })
-    
-    results["universities"] = results["universities"][:10]
-    results["programs"] = results["programs"][:30]
-    results["scholarships"] = results["scholarships"][:15]
+    query = " ".join(tokenize(q))
+    cache_key = (
+        "search", SEARCH_BACKEND, mode, threshold, query,
+        tuple(limits.items()), tuple(cursors.items())
+    )
+    generation = await current_generation_async()
+    cached = result_cache.get(generation, cache_key)
+    if cached is not None:
+        return cached
+    
+    try:
+        if SEARCH_BACKEND == "mongo":
+            results = await mongo_search(get_async_universities_collection(), query, limits, cursors)
+        else:
+            results = (await get_search_index()).search(
+                query, limits, fuzzy=(mode == "fuzzy"), threshold=threshold, cursors=cursors
+            )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     results["total_results"] = (
         len(results["universities"]) + 
@@ -382,41 +843,147 @@ def search_all(q: str):
         len(results["scholarships"])
     )
     
+    result_cache.set(generation, cache_key, results)
     return results
 
+@app.get("/api/programs")
+async def get_all_programs():
+    """Every program flattened to name/university/department/fee, for client-side search"""
+    async def load_programs():
+        pipeline = [
+            {"$unwind": "$programs"},
+            {"$project": {
+                "_id": 0,
+                "name": "$programs.name",
+                "university": "$name",
+                "department": {"$ifNull": ["$programs.department", ""]},
+                "fee": "$programs.total_fee_first_year"
+            }}
+        ]
+        programs = await (await get_async_universities_collection().aggregate(pipeline)).to_list()
+        return {"count": len(programs), "programs": programs}
+    
+    return await result_cache.get_or_compute_async(await current_generation_async(), ("programs",), load_programs)
+
+@app.get("/api/programs/search")
+async def search_programs(
+    q: Optional[str] = None,
+    city: Optional[str] = None,
+    department: Optional[str] = None,
+    entry_test: Optional[str] = None,
+    fee_min: Optional[int] = None,
+    fee_max: Optional[int] = None,
+    limit: int = Query(30, ge=1, le=100),
+    offset: int = Query(0, ge=0)
+):
+    """Filter programs by city, department, entry test and fee, with facet counts"""
+    filters = {
+        "city": city,
+        "department": department,
+        "entry_test": entry_test,
+        "fee": (fee_min, fee_max) if fee_min is not None or fee_max is not None else None
+    }
+    cache_key = ("programs-search", " ".join(tokenize(q)), tuple(filters.items()), limit, offset)
+    index = await get_search_index()
+    return result_cache.get_or_compute(
+        await current_generation_async(),
+        cache_key,
+        lambda: index.search_programs(q, filters, limit, offset)
+    )
+
+@app.get("/api/suggest")
+async def suggest(prefix: str, limit: int = Query(8, ge=1, le=MAX_SUGGESTIONS)):
+    """Autocomplete university, program and department names for search-as-you-type"""
+    index = await get_suggest_index()
+    return {
+        "prefix": prefix,
+        "suggestions": index.suggest(prefix, limit)
+    }
+
+DEADLINE_VIEWS = ("full", "compact", "upcoming", "past", "grouped")
+
 @app.get("/api/deadlines")
-def get_all_deadlines():
-    """Get all deadlines sorted by date"""
-    collection = get_universities_collection()
-    all_deadlines = []
+async def get_all_deadlines(view: str = "full"):
+    """Get all deadlines sorted by date
+
+    view=full keeps the original response. The other views list each
+    deadline once with a single ISO "date" field:
+    compact (upcoming then past), upcoming, past, or grouped by university.
+    """
+    if view not in DEADLINE_VIEWS:
+        raise HTTPException(status_code=400, detail=f"view must be one of: {', '.join(DEADLINE_VIEWS)}")
     
     # Get current date at midnight for accurate comparison
     current_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    generation = await current_generation_async()
     
-    for uni in collection.find():
-        uni_name = uni.get("name", "Unknown")
-        deadlines = uni.get("deadlines", [])
-        
-        for deadline in deadlines:
-            original_date_str = deadline.get("deadline_date", "")
-            parsed_date = parse_deadline_date(original_date_str)
-            
-            # Only include deadlines that could be parsed successfully
-            if parsed_date:
-                # Set to end of day (23:59:59) for deadline comparison
-                # This way, a deadline on "today" is still considered upcoming
-                deadline_end_of_day = parsed_date.replace(hour=23, minute=59, second=59, microsecond=999999)
-                
-                all_deadlines.append({
-                    "university_name": uni_name,
-                    "title": deadline.get("title", ""),
-                    "deadline_date": original_date_str,
-                    "parsed_date": parsed_date.strftime("%Y-%m-%d"),
-                    "timestamp": parsed_date.timestamp(),
-                    "university_city": uni.get("city", ""),
-                    # A deadline is past if the end of that day has passed
-                    "is_past": deadline_end_of_day < current_date
-                })
+    # is_past depends on today's date, so it is part of the cache key
+    full = await result_cache.get_or_compute_async(
+        generation,
+        ("deadlines", current_date.date().isoformat()),
+        lambda: build_all_deadlines(current_date)
+    )
+    if view == "full":
+        return full
+    return result_cache.get_or_compute(
+        generation,
+        ("deadlines", current_date.date().isoformat(), view),
+        lambda: build_deadlines_view(full, view)
+    )
+
+def build_deadlines_view(full, view):
+    """Re-shape the full /api/deadlines response into one of the lean views"""
+    def compact(d):
+        return {
+            "university_name": d["university_name"],
+            "university_city": d["university_city"],
+            "title": d["title"],
+            "date": d["parsed_date"],
+            "is_past": d["is_past"]
+        }
+    
+    counts = {
+        "total_deadlines": full["total_deadlines"],
+        "upcoming_count": full["upcoming_count"],
+        "past_count": full["past_count"]
+    }
+    if view == "compact":
+        return dict(counts, deadlines=[compact(d) for d in full["deadlines"]])
+    if view == "upcoming":
+        return dict(counts, deadlines=[compact(d) for d in full["upcoming_deadlines"]])
+    if view == "past":
+        return dict(counts, deadlines=[compact(d) for d in full["past_deadlines"]])
+    
+    universities = {}
+    for d in full["deadlines"]:
+        group = universities.setdefault(d["university_name"], {
+            "university_name": d["university_name"],
+            "university_city": d["university_city"],
+            "deadlines": []
+        })
+        group["deadlines"].append({"title": d["title"], "date": d["parsed_date"], "is_past": d["is_past"]})
+    return dict(counts, universities=list(universities.values()))
+
+async def build_all_deadlines(current_date):
+    """Build the /api/deadlines response from the embedded deadlines of every university"""
+    collection = get_async_universities_collection()
+    all_deadlines = []
+    today = current_date.strftime("%Y-%m-%d")
+    
+    async for uni in collection.find({}, {"name": 1, "city": 1, "deadlines": 1}):
+        # Only include deadlines that could be parsed successfully
+        for deadline in parsed_deadlines(uni):
+            all_deadlines.append({
+                "university_name": deadline["university_name"],
+                "title": deadline.get("title", ""),
+                "deadline_date": deadline.get("deadline_date", ""),
+                "parsed_date": deadline["deadline_iso"],
+                "timestamp": deadline["deadline_timestamp"],
+                "university_city": uni.get("city", ""),
+                # A deadline is past once its whole day has passed, so
+                # a deadline on "today" is still upcoming
+                "is_past": deadline["deadline_iso"] < today
+            })
     
     # Sort by timestamp (earliest first)
     all_deadlines.sort(key=lambda x: x.get("timestamp", 0))
@@ -433,4 +1000,97 @@ def get_all_deadlines():
         "deadlines": upcoming_deadlines + past_deadlines,  # Upcoming first, then past
         "upcoming_deadlines": upcoming_deadlines,
         "past_deadlines": past_deadlines
-    }
\ No newline at end of file
+    }
+
+@app.get("/api/deadlines/query")
+async def query_deadlines(
+    from_date: Optional[str] = Query(None, alias="from"),
+    to_date: Optional[str] = Query(None, alias="to"),
+    university: Optional[str] = None,
+    city: Optional[str] = None,
+    upcoming_only: bool = False,
+    limit: int = Query(50, ge=1, le=500)
+):
+    """Deadlines in a date range (YYYY-MM-DD), served by the deadline_iso index"""
+    for value in (from_date, to_date):
+        if value:
+            try:
+                datetime.strptime(value, "%Y-%m-%d")
+            except ValueError:
+                raise HTTPException(status_code=400, detail=f"Invalid date '{value}', expected YYYY-MM-DD")
+    
+    today = datetime.now().strftime("%Y-%m-%d")
+    if upcoming_only and (not from_date or from_date < today):
+        from_date = today
+    
+    query = {"deadline_parse_status": "parsed"}
+    date_range = {}
+    if from_date:
+        date_range["$gte"] = from_date
+    if to_date:
+        date_range["$lte"] = to_date
+    if date_range:
+        query["deadline_iso"] = date_range
+    
+    if university or city:
+        names = None
+        if university:
+            names = {university} | await university_names_matching(university_query(university))
+        if city:
+            city_names = await university_names_matching({"city_key": lookup_key(city)})
+            names = city_names if names is None else names & city_names
+        query["university_name"] = {"$in": sorted(names)}
+    
+    async def run_query():
+        deadlines = []
+        cursor = get_async_deadlines_collection().find(
+            query,
+            {"_id": 0, "university_name": 1, "title": 1, "deadline_date": 1, "deadline_iso": 1, "url": 1}
+        ).sort("deadline_iso", 1).limit(limit)
+        async for deadline in cursor:
+            deadline["is_past"] = deadline["deadline_iso"] < today
+            deadlines.append(deadline)
+        return {
+            "from": from_date,
+            "to": to_date,
+            "count": len(deadlines),
+            "deadlines": deadlines
+        }
+    
+    cache_key = ("deadlines-query", today, repr(sorted(query.items())), limit)
+    return await result_cache.get_or_compute_async(await current_generation_async(), cache_key, run_query)
+
+@app.get("/api/deadlines.ics")
+async def deadlines_calendar(request: Request):
+    """iCalendar feed of every university's deadlines"""
+    async def load_deadlines():
+        projection = {"name": 1, "admission_link": 1, "deadlines": 1}
+        deadlines = []
+        async for uni in get_async_universities_collection().find({}, projection):
+            deadlines.extend(parsed_deadlines(uni))
+        return deadlines
+    
+    return await calendar_response(request, ("ics", None), "University Admission Deadlines", load_deadlines)
+
+@app.get("/api/university/{name}/deadlines.ics")
+async def university_deadlines_calendar(name: str, request: Request):
+    """iCalendar feed of one university's deadlines"""
+    collection = get_async_universities_collection()
+    # Only the name here; the deadlines are read when the feed isn't cached
+    uni = await collection.find_one(university_query(name), {"name": 1})
+    if not uni:
+        raise HTTPException(status_code=404, detail="University not found")
+    
+    async def load_deadlines():
+        doc = await collection.find_one(
+            {"_id": uni["_id"]},
+            {"name": 1, "admission_link": 1, "deadlines": 1}
+        )
+        return list(parsed_deadlines(doc or {}))
+    
+    return await calendar_response(
+        request,
+        ("ics", uni["name"]),
+        f"{uni['name']} Admission Deadlines",
+        load_deadlines
+    )
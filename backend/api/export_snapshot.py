@@ -0,0 +1,135 @@
+"""Write the API's read-only responses as static JSON files for the frontend host
+
+Usage: python api/export_snapshot.py [output_dir]    (default: public/data)
+
+Run it where the frontend is deployed from, then deploy public/. Pages
+only use the snapshot while its generation matches the API's
+(/api/generation), so a snapshot left behind by a later scrape is ignored.
+
+Every file is named after a hash of its content, so the static host can
+cache it forever; manifest.json maps each dataset to its current file and
+is the only thing that has to be revalidated. The bytes are rendered by
+the same handlers and response class the API uses. Files referenced by
+the previous manifest are kept, so pages that loaded it still resolve.
+
+Snapshots live until the next scrape, so nothing in them may depend on
+today's date: deadlines are exported by date without is_past, and
+clients split them into upcoming and past themselves.
+"""
+import asyncio
+import hashlib
+import json
+import re
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from api.app import (
+    DefaultResponse,
+    get_aggregate_universities,
+    get_all_deadlines,
+    get_all_programs,
+    get_all_universities,
+    get_university,
+)
+from utils.generation import get_generation_info
+from utils.lookup import lookup_key
+
+DEFAULT_OUTPUT_DIR = Path(__file__).resolve().parent.parent.parent / "public" / "data"
+MANIFEST_NAME = "manifest.json"
+FILES_DIR = "files"
+
+
+def slug(name):
+    return re.sub(r"[^a-z0-9]+", "-", lookup_key(name)).strip("-")
+
+
+def undated_deadlines(full):
+    """The /api/deadlines view=full response reduced to date-independent fields, ordered by date"""
+    deadlines = sorted(
+        ({
+            "university_name": d["university_name"],
+            "university_city": d["university_city"],
+            "title": d["title"],
+            "date": d["parsed_date"]
+        } for d in full["deadlines"]),
+        key=lambda d: d["date"]
+    )
+    return {"total_deadlines": len(deadlines), "deadlines": deadlines}
+
+
+async def render_payloads():
+    """Response bodies keyed by dataset, plus one body per university name"""
+    universities = await get_all_universities()
+    datasets = {
+        "universities": universities,
+        "programs": await get_all_programs(),
+        "deadlines": undated_deadlines(await get_all_deadlines(view="full")),
+        "aggregate_universities": get_aggregate_universities(),
+    }
+    details = {}
+    for uni in universities:
+        details[uni["name"]] = await get_university(uni["name"], fields=None, programs_limit=None, programs_offset=0)
+    return datasets, details
+
+
+def write_hashed(output_dir, stem, payload):
+    """Write payload as <stem>.<hash>.json (once) and return its path relative to output_dir"""
+    body = DefaultResponse(payload).body
+    name = f"{stem}.{hashlib.sha256(body).hexdigest()[:12]}.json"
+    path = output_dir / FILES_DIR / name
+    if not path.exists():
+        path.write_bytes(body)
+    return f"{FILES_DIR}/{name}"
+
+
+def read_manifest(output_dir):
+    try:
+        return json.loads((output_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def manifest_paths(manifest):
+    if not manifest:
+        return set()
+    return set(manifest.get("files", {}).values()) | set(manifest.get("universities", {}).values())
+
+
+def export_snapshot(output_dir=DEFAULT_OUTPUT_DIR):
+    """Render every dataset, write the hashed files and manifest, and prune unreferenced files"""
+    output_dir = Path(output_dir)
+    (output_dir / FILES_DIR).mkdir(parents=True, exist_ok=True)
+
+    # Read first: if a scraper writes during the export, the manifest claims the older generation
+    generation = get_generation_info()["value"]
+    datasets, details = asyncio.run(render_payloads())
+
+    manifest = {
+        "generation": generation,
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "files": {key: write_hashed(output_dir, key.replace("_", "-"), payload) for key, payload in datasets.items()},
+        "universities": {
+            name: write_hashed(output_dir, f"university-{slug(name)}", payload)
+            for name, payload in details.items()
+        }
+    }
+
+    keep = manifest_paths(manifest) | manifest_paths(read_manifest(output_dir))
+    tmp = output_dir / f"{MANIFEST_NAME}.tmp"
+    tmp.write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+    tmp.replace(output_dir / MANIFEST_NAME)
+
+    for path in (output_dir / FILES_DIR).iterdir():
+        if f"{FILES_DIR}/{path.name}" not in keep:
+            path.unlink()
+    return manifest
+
+
+if __name__ == "__main__":
+    output_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_OUTPUT_DIR
+    manifest = export_snapshot(output_dir)
+    print(f"Exported generation {manifest['generation']}: "
+          f"{len(manifest['files'])} datasets, {len(manifest['universities'])} universities -> {output_dir}")
@@ -0,0 +1,134 @@
+"""Benchmark the deadline date parser against the original implementation
+
+Usage: python benchmarks/bench_deadline_parser.py [rounds]
+
+Uses every deadline string stored in MongoDB when MONGO_URI is set (both
+collections, i.e. what all scrapers wrote), otherwise a built-in sample of
+the formats the scrapers produce. Fails if the two parsers ever disagree.
+"""
+import os
+import re
+import sys
+import time
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.deadline_dates import parse_deadline_date, _parse_cached
+
+SAMPLE_STRINGS = [
+    "18 September, 2025, Thursday",
+    "25 September, 2025, Thursday",
+    "13 October, 2025, Monday",
+    "November onwards",
+    "15 August",
+    "April – July",
+    "August",
+    "Monday, January 5, 2026",
+    "Friday, August 15, 2025",
+    "March 3 - 10, 2026",
+    "June 20, 2025",
+    "Jun 20, 2025",
+    "20-06-2025",
+    "20/06/2025",
+    "2025-06-20",
+    "12/31/2025",
+    "20 June 2025",
+    "20 Jun 2025",
+    "Last date: July 1, 2025 (Tuesday)",
+    "Test Date\nSunday, July 13, 2025",
+    "TBA",
+    "",
+]
+
+
+def reference_parse_deadline_date(date_str):
+    """parse_deadline_date as it was before precompiling and memoizing"""
+    if not date_str or not isinstance(date_str, str):
+        return None
+    
+    date_str = date_str.strip()
+    
+    # Remove weekday names
+    date_str = re.sub(
+        r'^(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s*',
+        '',
+        date_str,
+        flags=re.IGNORECASE
+    )
+    
+    formats = [
+        "%B %d, %Y", "%b %d, %Y", "%d-%m-%Y", "%d/%m/%Y",
+        "%Y-%m-%d", "%m/%d/%Y", "%d %B %Y", "%d %b %Y",
+    ]
+    
+    # Try extracting date range
+    range_pattern = r'([A-Za-z]+)\s+(\d{1,2})\s*-\s*(\d{1,2}),?\s*(\d{4})'
+    range_match = re.search(range_pattern, date_str)
+    if range_match:
+        month, day1, day2, year = range_match.groups()
+        date_str = f"{month} {day2}, {year}"
+    
+    for fmt in formats:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    
+    # Try extracting "Month Day, Year"
+    month_day_year = r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s*(\d{4})'
+    match = re.search(month_day_year, date_str, re.IGNORECASE)
+    if match:
+        try:
+            extracted = f"{match.group(1)} {match.group(2)}, {match.group(3)}"
+            return datetime.strptime(extracted, "%B %d, %Y")
+        except ValueError:
+            pass
+    
+    return None
+
+
+def load_strings():
+    if not os.getenv("MONGO_URI"):
+        print("MONGO_URI not set, using built-in sample strings")
+        return SAMPLE_STRINGS
+
+    from config.db import get_universities_collection, get_deadlines_collection
+    strings = [d.get("deadline_date", "") for d in get_deadlines_collection().find({}, {"deadline_date": 1})]
+    for uni in get_universities_collection().find({}, {"deadlines.deadline_date": 1}):
+        strings.extend(d.get("deadline_date", "") for d in uni.get("deadlines", []))
+    print(f"Loaded {len(strings)} deadline strings from MongoDB")
+    return strings or SAMPLE_STRINGS
+
+
+def time_parser(parser, strings, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for s in strings:
+            parser(s)
+    return time.perf_counter() - start
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    strings = load_strings()
+
+    mismatches = [s for s in strings if parse_deadline_date(s) != reference_parse_deadline_date(s)]
+    if mismatches:
+        print(f"FAIL: {len(mismatches)} strings parse differently: {mismatches[:10]}")
+        sys.exit(1)
+    print(f"OK: identical results for {len(strings)} strings ({len(set(strings))} distinct)")
+
+    _parse_cached.cache_clear()
+    reference = time_parser(reference_parse_deadline_date, strings, rounds)
+    cold = time_parser(lambda s: (_parse_cached.cache_clear(), parse_deadline_date(s)), strings, rounds)
+    _parse_cached.cache_clear()
+    warm = time_parser(parse_deadline_date, strings, rounds)
+
+    calls = len(strings) * rounds
+    print(f"{'parser':<28}{'total (s)':>12}{'per call (us)':>16}{'speedup':>10}")
+    for label, elapsed in (("original", reference), ("compiled, no memo", cold), ("compiled + memo", warm)):
+        print(f"{label:<28}{elapsed:>12.4f}{elapsed / calls * 1e6:>16.2f}{reference / elapsed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Serialization time and bytes on the wire per endpoint, before and after
+
+Usage: python benchmarks/bench_serialization.py [rounds]
+
+"Before" is FastAPI's default JSONResponse (stdlib json, uncompressed);
+"after" is orjson plus gzip and, if installed, brotli at the middleware's
+default settings. With MONGO_URI set the payloads are the API's real
+responses; otherwise a synthetic dataset of the same shape is used.
+"""
+import gzip
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import orjson
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ENDPOINTS = [
+    "/api/universities",
+    "/api/university/PU",
+    "/api/deadlines",
+    "/api/deadlines?view=compact",
+    "/api/programs",
+    "/api/search?q=computer",
+]
+
+
+def stdlib_render(payload):
+    # What starlette's JSONResponse.render does
+    return json.dumps(payload, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def orjson_render(payload):
+    return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+def synthetic_payloads():
+    random.seed(7)
+    departments = ["Computer Science", "Electrical Engineering", "Business", "Economics", "Law", "Physics"]
+    universities = []
+    for u in range(14):
+        programs = [{
+            "name": f"BS {random.choice(departments)} {p}",
+            "department": random.choice(departments),
+            "fee_per_semester": random.randint(50, 600) * 1000,
+            "total_fee_first_year": random.randint(100, 1200) * 1000,
+            "eligibility": {"min_percentage_matric": 60.0, "min_percentage_inter": 60.0, "entry_test": "Entry test", "notes": ""},
+            "notes": ""
+        } for p in range(120 if u == 0 else 30)]
+        deadlines = [{
+            "title": f"Deadline {d}",
+            "deadline_date": f"June {d + 1}, 2026",
+            "deadline_iso": f"2026-06-{d + 1:02d}",
+            "deadline_timestamp": 1780000000.0 + d,
+            "deadline_parse_status": "parsed"
+        } for d in range(8)]
+        universities.append({
+            "_id": f"{u:024x}",
+            "name": "PU" if u == 0 else f"UNI{u}",
+            "full_name": f"University number {u}",
+            "city": random.choice(["Lahore", "Islamabad", "Karachi"]),
+            "website": "https://example.edu.pk",
+            "programs": programs,
+            "scholarships": [{"name": f"Scholarship {s}", "type": "Need-based", "link": ""} for s in range(6)],
+            "deadlines": deadlines
+        })
+
+    full_deadlines = [{
+        "university_name": uni["name"], "title": d["title"], "deadline_date": d["deadline_date"],
+        "parsed_date": d["deadline_iso"], "timestamp": d["deadline_timestamp"],
+        "university_city": uni["city"], "is_past": False
+    } for uni in universities for d in uni["deadlines"]]
+    programs = [{"name": p["name"], "university": uni["name"], "department": p["department"], "fee": p["total_fee_first_year"]}
+                for uni in universities for p in uni["programs"]]
+    return {
+        "/api/universities": [{"name": u["name"], "full_name": u["full_name"], "city": u["city"]} for u in universities],
+        "/api/university/PU": universities[0],
+        "/api/deadlines": {
+            "total_deadlines": len(full_deadlines), "upcoming_count": len(full_deadlines), "past_count": 0,
+            "deadlines": full_deadlines, "upcoming_deadlines": full_deadlines, "past_deadlines": []
+        },
+        "/api/deadlines?view=compact": {
+            "total_deadlines": len(full_deadlines),
+            "deadlines": [{"university_name": d["university_name"], "university_city": d["university_city"],
+                           "title": d["title"], "date": d["parsed_date"], "is_past": False} for d in full_deadlines]
+        },
+        "/api/programs": {"count": len(programs), "programs": programs},
+        "/api/search?q=computer": {"universities": [], "programs": programs[:30], "scholarships": [], "total_results": 30},
+    }
+
+
+def live_payloads():
+    from fastapi.testclient import TestClient
+    from api.app import app
+
+    payloads = {}
+    with TestClient(app) as client:
+        for endpoint in ENDPOINTS:
+            response = client.get(endpoint, headers={"Accept-Encoding": "identity"})
+            payloads[endpoint] = response.json()
+    return payloads
+
+
+def timed(render, payload, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        body = render(payload)
+    return (time.perf_counter() - start) / rounds * 1e3, body
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    if os.getenv("MONGO_URI"):
+        payloads = live_payloads()
+    else:
+        print("MONGO_URI not set, using a synthetic dataset")
+        payloads = synthetic_payloads()
+
+    header = f"{'endpoint':<30}{'json ms':>9}{'orjson ms':>11}{'raw B':>10}{'gzip B':>10}"
+    if brotli:
+        header += f"{'br B':>10}"
+    print(header)
+    for endpoint, payload in payloads.items():
+        before_ms, before_body = timed(stdlib_render, payload, rounds)
+        after_ms, after_body = timed(orjson_render, payload, rounds)
+        assert json.loads(before_body) == json.loads(after_body), endpoint
+        # GZipMiddleware's default level, and brotli-asgi's default quality
+        line = f"{endpoint:<30}{before_ms:>9.3f}{after_ms:>11.3f}{len(before_body):>10}{len(gzip.compress(after_body, 9)):>10}"
+        if brotli:
+            line += f"{len(brotli.compress(after_body, quality=4)):>10}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Concurrent throughput of /api/search and /api/university/{name} against a running API
+
+Usage: python benchmarks/load_test.py [base_url] [requests_per_level]
+
+Each concurrency level sends requests_per_level requests through that many
+concurrent connections and reports requests/s and p50/p95 latency. To see
+the effect of the async data layer, run it once against the previous
+(sync pymongo) build and once against this one, for example:
+
+    RESULT_CACHE_SIZE=0 UNIVERSITY_CACHE_SIZE=0 uvicorn api.app:app --workers 1
+    python benchmarks/load_test.py http://localhost:8000 1000
+
+Disabling the result and university caches makes every request reach
+MongoDB, which is the path the async driver changes. Needs httpx.
+"""
+import asyncio
+import itertools
+import statistics
+import sys
+import time
+
+import httpx
+
+CONCURRENCY_LEVELS = [1, 10, 50, 100]
+SEARCH_QUERIES = ["computer", "engineering", "business", "science", "medical", "law", "data", "software"]
+
+
+async def run_level(client, paths, concurrency, total):
+    latencies = []
+    errors = 0
+    next_path = itertools.cycle(paths)
+    remaining = total
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            try:
+                response = await client.get(next(next_path))
+                if response.status_code != 200:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append((time.perf_counter() - start) * 1e3)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "errors": errors
+    }
+
+
+async def main():
+    base_url = sys.argv[1] if len(sys.argv) > 1 else "http://localhost:8000"
+    total = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    limits = httpx.Limits(max_connections=max(CONCURRENCY_LEVELS))
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        names = [uni["name"] for uni in (await client.get("/api/universities")).json()]
+        scenarios = {
+            "/api/search": [f"/api/search?q={q}" for q in SEARCH_QUERIES],
+            "/api/university/{name}": [f"/api/university/{name}" for name in names],
+        }
+
+        print(f"{'endpoint':<26}{'conc':>6}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'errors':>8}")
+        for endpoint, paths in scenarios.items():
+            for concurrency in CONCURRENCY_LEVELS:
+                result = await run_level(client, paths, concurrency, total)
+                print(f"{endpoint:<26}{concurrency:>6}{result['rps']:>10.1f}{result['p50']:>10.1f}"
+                      f"{result['p95']:>10.1f}{result['errors']:>8}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
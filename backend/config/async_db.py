@@ -0,0 +1,29 @@
+from pymongo import AsyncMongoClient
+
+from config.db import MONGO_URI
+from config.settings import MONGO_MAX_POOL_SIZE, MONGO_MIN_POOL_SIZE
+
+
+# Used by the API's async handlers; scrapers and startup jobs keep the sync client in config.db.
+# The client connects lazily, on the event loop of its first operation.
+client = AsyncMongoClient(MONGO_URI, maxPoolSize=MONGO_MAX_POOL_SIZE, minPoolSize=MONGO_MIN_POOL_SIZE)
+
+db = client['UniversityGuide']
+
+universities_collection = db['universities']
+deadlines_collection = db['deadlines']
+meta_collection = db['meta']
+
+
+# Helper functions
+def get_async_db():
+    return db
+
+def get_async_universities_collection():
+    return universities_collection
+
+def get_async_deadlines_collection():
+    return deadlines_collection
+
+def get_async_meta_collection():
+    return meta_collection
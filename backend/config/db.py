@@ -1,8 +1,11 @@
 
 import os
-from pymongo import MongoClient
+from pymongo import MongoClient, ASCENDING
+from pymongo.errors import OperationFailure
 from dotenv import load_dotenv
 
+from config.settings import MONGO_MAX_POOL_SIZE, MONGO_MIN_POOL_SIZE
+
 
 load_dotenv()
 MONGO_URI = os.getenv("MONGO_URI")
@@ -10,7 +13,7 @@ if not MONGO_URI:
     print(" ERROR: Can't find MONGO_URI in .env file!")
     exit()
 try:
-    client = MongoClient(MONGO_URI)
+    client = MongoClient(MONGO_URI, maxPoolSize=MONGO_MAX_POOL_SIZE, minPoolSize=MONGO_MIN_POOL_SIZE)
     # Test if connection works
     client.admin.command('ping')
     print(" Connected to MongoDB successfully!")
@@ -22,6 +25,7 @@ db = client['UniversityGuide']
 
 universities_collection = db['universities']
 deadlines_collection = db['deadlines']
+meta_collection = db['meta']
 
 
 # Helper functions
@@ -34,6 +38,29 @@ def get_universities_collection():
 def get_deadlines_collection():
     return deadlines_collection
 
+def get_meta_collection():
+    return meta_collection
+
+def ensure_indexes():
+    """Create the indexes the API's queries rely on (no-op for existing ones)"""
+    # A lookup key may only point at one university
+    try:
+        universities_collection.create_index(
+            [("lookup_keys", ASCENDING)],
+            name="lookup_keys",
+            unique=True,
+            partialFilterExpression={"lookup_keys": {"$exists": True}}
+        )
+    except OperationFailure as e:
+        print(f" WARNING: lookup_keys are not unique ({e}), creating a non-unique index")
+        universities_collection.create_index([("lookup_keys", ASCENDING)], name="lookup_keys_nonunique")
+    universities_collection.create_index([("city_key", ASCENDING)], name="city_key")
+    deadlines_collection.create_index([("deadline_iso", ASCENDING)], name="deadline_iso")
+    deadlines_collection.create_index(
+        [("university_name", ASCENDING), ("deadline_iso", ASCENDING)],
+        name="university_deadline_iso"
+    )
+
 
 if __name__ == "__main__":
     collections = db.list_collection_names()
@@ -0,0 +1,40 @@
+import os
+from dotenv import load_dotenv
+
+
+load_dotenv()
+
+# Which engine answers /api/search: "index" (in-memory BM25) or "mongo" (MongoDB text index)
+SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "index").lower()
+if SEARCH_BACKEND not in ("index", "mongo"):
+    print(f" WARNING: Unknown SEARCH_BACKEND '{SEARCH_BACKEND}', using 'index'")
+    SEARCH_BACKEND = "index"
+
+# How often (seconds) the API re-reads the data generation written by scrapers; 0 = every request
+GENERATION_POLL_SECONDS = float(os.getenv("GENERATION_POLL_SECONDS", "5"))
+
+# Result cache for /api/search and /api/deadlines
+RESULT_CACHE_SIZE = int(os.getenv("RESULT_CACHE_SIZE", "512"))
+RESULT_CACHE_TTL = float(os.getenv("RESULT_CACHE_TTL", "300"))
+
+# Server-Sent Events: how often the watcher checks for new data, and the keep-alive interval
+EVENTS_POLL_SECONDS = float(os.getenv("EVENTS_POLL_SECONDS", "5"))
+EVENTS_KEEPALIVE_SECONDS = float(os.getenv("EVENTS_KEEPALIVE_SECONDS", "15"))
+
+# In-process cache of university documents (entries are lookup keys; 0 disables it)
+UNIVERSITY_CACHE_SIZE = int(os.getenv("UNIVERSITY_CACHE_SIZE", "512"))
+# Load every university into the cache at startup and after each data change
+UNIVERSITY_CACHE_PREWARM = os.getenv("UNIVERSITY_CACHE_PREWARM", "false").lower() in ("1", "true", "yes")
+
+# Cache-Control max-age (seconds) for read endpoints that support conditional GET
+HTTP_CACHE_MAX_AGE = int(os.getenv("HTTP_CACHE_MAX_AGE", "60"))
+
+# Responses smaller than this many bytes are not compressed
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+
+# Most universities one /api/compare request may ask for
+COMPARE_MAX_UNIVERSITIES = int(os.getenv("COMPARE_MAX_UNIVERSITIES", "8"))
+
+# MongoDB connection pool, per client (the API has one sync and one async client)
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "100"))
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))
@@ -8,6 +8,8 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from config.db import get_db
+from utils.generation import bump_generation
+from utils.ingest import prepare_university, prepare_deadline
 from models.university import University, Program, Eligibility, Scholarship, EmbeddedDeadline
 from models.deadline import Deadline
 
@@ -236,9 +238,10 @@ def save_to_database():
     db = get_db()
     db.universities.delete_many({"name": "AU"})
     db.deadlines.delete_many({"university_name": "AU"})
-    db.universities.insert_one(au.dict())
+    db.universities.insert_one(prepare_university(au))
     if deadlinedb:
-        db.deadlines.insert_many([d.dict() for d in deadlinedb])
+        db.deadlines.insert_many([prepare_deadline(d) for d in deadlinedb])
+    bump_generation("AU")
     print("✓ AU data saved to database")
 
 if __name__ == "__main__":
@@ -9,6 +9,8 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config.db import get_db
+from utils.generation import bump_generation
+from utils.ingest import prepare_university, prepare_deadline
 from models.university import University, EmbeddedDeadline, Scholarship, Eligibility, Program
 from models.deadline import Deadline
 
@@ -191,17 +193,18 @@ comsats_university = University(
     deadlines=alldeadlines
 )
 
-db.universities.insert_one(comsats_university.dict())
+db.universities.insert_one(prepare_university(comsats_university))
 
 for d in alldeadlines:
     db.deadlines.insert_one(
-        Deadline(
+        prepare_deadline(Deadline(
             university_name="COMSATS Lahore",
             title=d.title,
             deadline_date=d.deadline_date,
             url=url
-        ).dict()
+        ))
     )
+bump_generation("COMSATS Lahore")
 
 print("COMSATS Lahore saved successfully!")
 
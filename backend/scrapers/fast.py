@@ -5,6 +5,8 @@ from bs4 import BeautifulSoup
 import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from config.db import get_db
+from utils.generation import bump_generation
+from utils.ingest import prepare_university, prepare_deadline
 from models.university import University, Program, Eligibility, Scholarship, EmbeddedDeadline
 from models.deadline import Deadline
 
@@ -150,8 +152,9 @@ def save_to_database():
     db = get_db()
     db.universities.delete_many({"name": "FAST-NU Lahore"})
     db.deadlines.delete_many({"university_name": "FAST-NU Lahore"})
-    db.universities.insert_one(fast.dict())
-    db.deadlines.insert_many([d.dict() for d in deadline])
+    db.universities.insert_one(prepare_university(fast))
+    db.deadlines.insert_many([prepare_deadline(d) for d in deadline])
+    bump_generation("FAST-NU Lahore")
 
 
 
@@ -5,6 +5,8 @@ from bs4 import BeautifulSoup
 import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from config.db import get_db
+from utils.generation import bump_generation
+from utils.ingest import prepare_university, prepare_deadline
 from models.university import University, Program, Eligibility, Scholarship, EmbeddedDeadline
 from models.deadline import Deadline
 import urllib3
@@ -182,8 +184,9 @@ def save_to_database():
     db = get_db()
     db.universities.delete_many({"name": "GIKI"})
     db.deadlines.delete_many({"university_name": "GIKI"})
-    db.universities.insert_one(basicinfo.dict())
-    db.deadlines.insert_many([d.dict() for d in standalone_deadlines])
+    db.universities.insert_one(prepare_university(basicinfo))
+    db.deadlines.insert_many([prepare_deadline(d) for d in standalone_deadlines])
+    bump_generation("GIKI")
 
 if __name__ == "__main__":
     save_to_database()
@@ -10,6 +10,8 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 # Now you can import config and models
 from config.db import get_db, get_deadlines_collection
+from utils.generation import bump_generation
+from utils.ingest import prepare_university, prepare_deadline
 from models.university import University, Program, Eligibility, Scholarship, EmbeddedDeadline
 from models.deadline import Deadline
 
@@ -402,7 +404,7 @@ db = get_db()
 db.universities.delete_many({"name": "IBA Karachi"})
 
 db.universities.insert_one(
-    University(
+    prepare_university(University(
         name="IBA Karachi",
         full_name="Institute of Business Administration, Karachi",
         city="Karachi",
@@ -413,12 +415,13 @@ db.universities.insert_one(
         programs=iba_programs,
         scholarships=scholarships,
         deadlines=embedded_deadlines
-    ).dict()
+    ))
 )
 
 get_deadlines_collection().delete_many({"university_name": "IBA Karachi"})
 get_deadlines_collection().insert_many(
-    [d.dict() for d in standalone_deadlines]
+    [prepare_deadline(d) for d in standalone_deadlines]
 )
+bump_generation("IBA Karachi")
 
 print("\n✅ IBA data scraped & saved successfully to MongoDB!")
\ No newline at end of file
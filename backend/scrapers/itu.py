@@ -9,6 +9,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from models.university import University, Program, Eligibility, Scholarship, EmbeddedDeadline
 from models.deadline import Deadline
 from config.db import get_db
+from utils.generation import bump_generation
+from utils.ingest import prepare_university, prepare_deadline
 db = get_db()
 
 r = requests.get("https://itu.edu.pk/financial-assistance/")
@@ -234,8 +236,9 @@ def save_to_database():
     db = get_db()
     db.universities.delete_many({"name": "ITU"})
     db.deadlines.delete_many({"university_name": "Information Technology University of the Punjab"})
-    db.universities.insert_one(itu.dict())
-    db.deadlines.insert_many([d.dict() for d in standalone_deadlines])
+    db.universities.insert_one(prepare_university(itu))
+    db.deadlines.insert_many([prepare_deadline(d) for d in standalone_deadlines])
+    bump_generation("ITU")
 
 if __name__ == "__main__":
     save_to_database()
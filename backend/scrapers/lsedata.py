@@ -5,6 +5,8 @@ from bs4 import BeautifulSoup
 import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from config.db import get_db
+from utils.generation import bump_generation
+from utils.ingest import prepare_university
 from models.university import University, Program, Eligibility, Scholarship, EmbeddedDeadline
 from models.deadline import Deadline
 import urllib3
@@ -138,9 +140,10 @@ collection = db["universities"]
 
 result = collection.replace_one(
     {"name": lse_data.name},
-    lse_data.dict(),
+    prepare_university(lse_data),
     upsert=True
 )
+bump_generation(lse_data.name)
 
 if result.matched_count > 0:
     print("\nUniversity programs updated with fees in the database.")
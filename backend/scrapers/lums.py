@@ -5,6 +5,8 @@ from bs4 import BeautifulSoup
 import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from config.db import get_db
+from utils.generation import bump_generation
+from utils.ingest import prepare_university, prepare_deadline
 from models.university import University, Program, Eligibility, Scholarship, EmbeddedDeadline
 from models.deadline import Deadline
 
@@ -309,7 +311,7 @@ def save_to_database():
     db.universities.delete_many({"name": "LUMS"})
     db.deadlines.delete_many({"university_name": "LUMS"})
     
-    db.universities.insert_one(lums.dict())
+    db.universities.insert_one(prepare_university(lums))
     
     for d in alldeadlines:
         deadline_obj = Deadline(
@@ -317,7 +319,8 @@ def save_to_database():
             title=d["title"],
             deadline_date=d["deadline_date"],
         )
-        db.deadlines.insert_one(deadline_obj.dict())
+        db.deadlines.insert_one(prepare_deadline(deadline_obj))
+    bump_generation("LUMS")
     
     print("LUMS data saved successfully")
 
@@ -10,6 +10,8 @@ from models.deadline import Deadline
 
 # Import DB config
 from config.db import get_db, get_deadlines_collection
+from utils.generation import bump_generation
+from utils.ingest import prepare_university, prepare_deadline
 
 # Import selenium and beautifulsoup
 from selenium import webdriver
@@ -281,7 +283,7 @@ if scraped_programs:
 
     # Insert university
     try:
-        insert_result = db.universities.insert_one(nust_data.dict())
+        insert_result = db.universities.insert_one(prepare_university(nust_data))
         print(f"✅ Inserted NUST with {len(scraped_programs)} programs")
     except Exception as e:
         print(f"❌ Error inserting university: {e}")
@@ -289,5 +291,7 @@ if scraped_programs:
     # Insert standalone deadlines
     if standalone_deadlines:
         get_deadlines_collection().delete_many({"university_name": "NUST Islamabad"})
-        get_deadlines_collection().insert_many([d.dict() for d in standalone_deadlines])
+        get_deadlines_collection().insert_many([prepare_deadline(d) for d in standalone_deadlines])
         print(f"✅ Inserted {len(standalone_deadlines)} standalone deadlines")
+
+    bump_generation("NUST Islamabad")
@@ -5,6 +5,8 @@ from bs4 import BeautifulSoup
 import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from config.db import get_db, get_deadlines_collection
+from utils.generation import bump_generation
+from utils.ingest import prepare_university, prepare_deadline
 from models.university import University, Program, Eligibility, Scholarship, EmbeddedDeadline
 from models.deadline import Deadline
 import urllib3
@@ -336,7 +338,7 @@ db = get_db()
 db.universities.delete_many({"name": "PIEAS Islamabad"})
 
 db.universities.insert_one(
-    University(
+    prepare_university(University(
         name="PIEAS Islamabad",
         full_name="Pakistan Institute of Engineering and Applied Sciences",
         city="Islamabad",
@@ -347,10 +349,11 @@ db.universities.insert_one(
         programs=programs,
         scholarships=pieas_scholarships,
         deadlines=embedded_deadlines
-    ).dict()
+    ))
 )
 
 get_deadlines_collection().delete_many({"university_name": "PIEAS Islamabad"})
-get_deadlines_collection().insert_many([d.dict() for d in standalone_deadlines])
+get_deadlines_collection().insert_many([prepare_deadline(d) for d in standalone_deadlines])
+bump_generation("PIEAS Islamabad")
 
 print("PIEAS data scraped & saved successfully")
\ No newline at end of file
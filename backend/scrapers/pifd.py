@@ -10,6 +10,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from models.university import University, Program, Eligibility, Scholarship, EmbeddedDeadline
 from models.deadline import Deadline
 from config.db import get_db
+from utils.generation import bump_generation
+from utils.ingest import prepare_university, prepare_deadline
 db = get_db()
 url = "https://pifd.edu.pk/admission.html"
 headers = {
@@ -177,8 +179,9 @@ def save_to_database():
     db = get_db()
     db.universities.delete_many({"name": "PIFD"})
     db.deadlines.delete_many({"university_name": "Pakistan Institute of Fashion and Design"})
-    db.universities.insert_one(pifd.dict())
-    db.deadlines.insert_many([d.dict() for d in standalone_deadlines])
+    db.universities.insert_one(prepare_university(pifd))
+    db.deadlines.insert_many([prepare_deadline(d) for d in standalone_deadlines])
+    bump_generation("PIFD")
 
 if __name__ == "__main__":
     save_to_database()
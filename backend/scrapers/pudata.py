@@ -5,6 +5,8 @@ from bs4 import BeautifulSoup
 import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from config.db import get_db
+from utils.generation import bump_generation
+from utils.ingest import prepare_university
 from models.university import University, Program, Eligibility, Scholarship, EmbeddedDeadline
 from models.deadline import Deadline
 
@@ -178,7 +180,8 @@ try:
     db.universities.delete_many({"name": "PU"})
     db.deadlines.delete_many({"university_name": "PU"})
     
-    db.universities.insert_one(pu_data.dict())
+    db.universities.insert_one(prepare_university(pu_data))
+    bump_generation("PU")
 
 except Exception as e:
     print("Error inserting PU data:", e)
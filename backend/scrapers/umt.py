@@ -11,6 +11,8 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config.db import get_db
+from utils.generation import bump_generation
+from utils.ingest import prepare_university, prepare_deadline
 from models.university import (
     University, Program, Eligibility, Scholarship, EmbeddedDeadline
 )
@@ -237,7 +239,7 @@ db.Universities.delete_many({"name": "UMT"})
 db.deadlines.delete_many({"university_name": "UMT"})
 
 # Insert fresh data
-db.Universities.insert_one(umt.dict())
+db.Universities.insert_one(prepare_university(umt))
 
 standalone_deadlines = []
 for d in deadlines:
@@ -256,8 +258,9 @@ def save_to_database():
     db = get_db()
     db.universities.delete_many({"name": "UMT"})
     db.deadlines.delete_many({"university_name": "University of Management and Technology"})
-    db.universities.insert_one(umt.dict())
-    db.deadlines.insert_many([d.dict() for d in standalone_deadlines])
+    db.universities.insert_one(prepare_university(umt))
+    db.deadlines.insert_many([prepare_deadline(d) for d in standalone_deadlines])
+    bump_generation("UMT")
 
 if __name__ == "__main__":
     save_to_database()
@@ -0,0 +1,74 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResultCache:
+    """Thread-safe LRU cache with a TTL, keyed by data generation
+
+    Entries stored under one generation are never returned for another, so
+    a bump of the generation invalidates everything cached before it.
+    """
+
+    def __init__(self, maxsize=512, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, generation, key):
+        full_key = (generation, key)
+        now = time.monotonic()
+        with self.lock:
+            entry = self.entries.get(full_key)
+            if entry is not None and (not self.ttl or now - entry[0] < self.ttl):
+                self.entries.move_to_end(full_key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self.entries[full_key]
+            self.misses += 1
+            return None
+
+    def set(self, generation, key, value):
+        with self.lock:
+            self.entries[(generation, key)] = (time.monotonic(), value)
+            self.entries.move_to_end((generation, key))
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, generation, key, compute):
+        value = self.get(generation, key)
+        if value is None:
+            value = compute()
+            self.set(generation, key, value)
+        return value
+
+    async def get_or_compute_async(self, generation, key, compute):
+        """get_or_compute for a coroutine function compute"""
+        value = self.get(generation, key)
+        if value is None:
+            value = await compute()
+            self.set(generation, key, value)
+        return value
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self.entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0
+            }
@@ -0,0 +1,29 @@
+from starlette.middleware.gzip import GZipMiddleware
+
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:
+    BrotliMiddleware = None
+
+
+class CompressionMiddleware:
+    """Brotli or gzip response compression, whichever the client accepts
+
+    Falls back to gzip only when brotli-asgi isn't installed. Responses
+    smaller than minimum_size are sent as-is, and excluded_paths (streams
+    such as Server-Sent Events) are never buffered for compression.
+    """
+
+    def __init__(self, app, minimum_size=1024, excluded_paths=()):
+        self.app = app
+        self.excluded_paths = set(excluded_paths)
+        if BrotliMiddleware is not None:
+            self.compressor = BrotliMiddleware(app, minimum_size=minimum_size, gzip_fallback=True)
+        else:
+            self.compressor = GZipMiddleware(app, minimum_size=minimum_size)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] not in self.excluded_paths:
+            await self.compressor(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
@@ -0,0 +1,96 @@
+import re
+from datetime import datetime
+from functools import lru_cache
+
+# Distinct raw strings remembered by parse_deadline_date; scrapers produce a few hundred
+PARSE_CACHE_SIZE = 4096
+
+WEEKDAY_RE = re.compile(
+    r'^(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s*',
+    re.IGNORECASE
+)
+RANGE_RE = re.compile(r'([A-Za-z]+)\s+(\d{1,2})\s*-\s*(\d{1,2}),?\s*(\d{4})')
+MONTH_DAY_YEAR_RE = re.compile(
+    r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s*(\d{4})',
+    re.IGNORECASE
+)
+
+
+def _has_alpha(s):
+    return any(c.isalpha() for c in s)
+
+
+# Formats in the order they are tried, each with a cheap test that must hold
+# for strptime to have any chance of matching. Skipping formats that fail the
+# test never changes which format wins, it only avoids raising ValueError.
+FORMATS = [
+    ("%B %d, %Y", lambda s: s[0].isalpha() and "," in s),
+    ("%b %d, %Y", lambda s: s[0].isalpha() and "," in s),
+    ("%d-%m-%Y", lambda s: s[0].isdigit() and "-" in s),
+    ("%d/%m/%Y", lambda s: s[0].isdigit() and "/" in s),
+    ("%Y-%m-%d", lambda s: s[0].isdigit() and "-" in s),
+    ("%m/%d/%Y", lambda s: s[0].isdigit() and "/" in s),
+    ("%d %B %Y", lambda s: s[0].isdigit() and _has_alpha(s)),
+    ("%d %b %Y", lambda s: s[0].isdigit() and _has_alpha(s)),
+]
+
+
+def parse_deadline_date(date_str):
+    """Parse various date formats and return a datetime object."""
+    if not date_str or not isinstance(date_str, str):
+        return None
+    return _parse_cached(date_str)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_cached(date_str):
+    date_str = date_str.strip()
+    
+    # Remove weekday names
+    date_str = WEEKDAY_RE.sub('', date_str)
+    
+    # Try extracting date range
+    range_match = RANGE_RE.search(date_str)
+    if range_match:
+        month, day1, day2, year = range_match.groups()
+        date_str = f"{month} {day2}, {year}"
+    
+    if date_str:
+        for fmt, could_match in FORMATS:
+            if not could_match(date_str):
+                continue
+            try:
+                return datetime.strptime(date_str, fmt)
+            except ValueError:
+                continue
+    
+    # Try extracting "Month Day, Year"
+    match = MONTH_DAY_YEAR_RE.search(date_str)
+    if match:
+        try:
+            extracted = f"{match.group(1)} {match.group(2)}, {match.group(3)}"
+            return datetime.strptime(extracted, "%B %d, %Y")
+        except ValueError:
+            pass
+    
+    return None
+
+
+def normalize_deadline(deadline):
+    """Add the parsed form of deadline["deadline_date"] to a deadline dict
+
+    Sets deadline_iso (YYYY-MM-DD), deadline_timestamp and
+    deadline_parse_status ("parsed", "unparsed" or "missing") so readers
+    never have to parse the raw string again.
+    """
+    date_str = deadline.get("deadline_date")
+    parsed = parse_deadline_date(date_str)
+    if parsed:
+        deadline["deadline_iso"] = parsed.strftime("%Y-%m-%d")
+        deadline["deadline_timestamp"] = parsed.timestamp()
+        deadline["deadline_parse_status"] = "parsed"
+    else:
+        deadline["deadline_iso"] = None
+        deadline["deadline_timestamp"] = None
+        deadline["deadline_parse_status"] = "unparsed" if date_str else "missing"
+    return deadline
@@ -0,0 +1,48 @@
+import asyncio
+import hashlib
+import json
+
+
+def format_event(event, data, event_id=None):
+    """Encode one Server-Sent Event"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+def deadline_digests(documents):
+    """Fingerprint of each university's deadlines, to tell which ones changed"""
+    digests = {}
+    for uni in documents:
+        entries = sorted(
+            f'{d.get("title", "")}|{d.get("deadline_date", "")}' for d in uni.get("deadlines", [])
+        )
+        digests[uni.get("name", "")] = hashlib.sha1("\n".join(entries).encode("utf-8")).hexdigest()
+    return digests
+
+
+class EventHub:
+    """Fan-out of events from one background watcher to every connected SSE client"""
+
+    def __init__(self, queue_size=100):
+        self.queue_size = queue_size
+        self.subscribers = set()
+
+    def subscribe(self):
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self.subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue):
+        self.subscribers.discard(queue)
+
+    def publish(self, message):
+        for queue in list(self.subscribers):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # A client that stopped reading only misses events, it can't stall the others
+                pass
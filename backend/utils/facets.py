@@ -0,0 +1,113 @@
+from bisect import bisect_left, bisect_right
+
+# Fee buckets reported as the fee_range facet (first-year fee in PKR)
+FEE_BUCKETS = [
+    ("under-100k", 0, 100000),
+    ("100k-250k", 100000, 250000),
+    ("250k-500k", 250000, 500000),
+    ("500k-1m", 500000, 1000000),
+    ("1m-plus", 1000000, None),
+]
+
+FACETS = ("city", "department", "entry_test", "fee_range")
+
+
+def facet_key(value):
+    return " ".join(str(value).lower().split())
+
+
+def iter_bits(bits):
+    """Yield the positions of set bits, lowest first"""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+class FacetIndex:
+    """Per-facet posting lists over programs, stored as int bitsets
+
+    Bit i of a value's bitset is set when program i has that value, so
+    filtering is a handful of ANDs and a facet count is a popcount.
+    Program ids line up with the programs category of SearchIndex.
+    """
+
+    def __init__(self):
+        self.postings = {facet: {} for facet in FACETS}
+        self.labels = {facet: {} for facet in FACETS}
+        self.fees = []
+        self.fee_values = []
+        self.size = 0
+
+    def add(self, item_id, values, fee):
+        for facet, value in values.items():
+            if not value:
+                continue
+            key = facet_key(value)
+            self.labels[facet].setdefault(key, str(value).strip())
+            self.postings[facet][key] = self.postings[facet].get(key, 0) | (1 << item_id)
+
+        if isinstance(fee, (int, float)) and fee > 0:
+            self.fees.append((fee, item_id))
+            for label, low, high in FEE_BUCKETS:
+                if fee >= low and (high is None or fee < high):
+                    self.labels["fee_range"][label] = label
+                    self.postings["fee_range"][label] = self.postings["fee_range"].get(label, 0) | (1 << item_id)
+                    break
+        self.size = max(self.size, item_id + 1)
+
+    def finalize(self):
+        self.fees.sort()
+        self.fee_values = [fee for fee, _ in self.fees]
+
+    @property
+    def all_bits(self):
+        return (1 << self.size) - 1
+
+    def fee_bits(self, fee_min=None, fee_max=None):
+        """Bitset of programs whose fee lies in [fee_min, fee_max]"""
+        start = bisect_left(self.fee_values, fee_min) if fee_min is not None else 0
+        end = bisect_right(self.fee_values, fee_max) if fee_max is not None else len(self.fee_values)
+        bits = 0
+        for _, item_id in self.fees[start:end]:
+            bits |= 1 << item_id
+        return bits
+
+    def filter_bits(self, filters, skip=None):
+        """AND together the bitsets of every active filter except the skip facet"""
+        bits = self.all_bits
+        for facet, value in filters.items():
+            if facet == skip or value is None:
+                continue
+            if facet == "fee":
+                bits &= self.fee_bits(*value)
+            else:
+                bits &= self.postings[facet].get(facet_key(value), 0)
+        return bits
+
+    def counts(self, candidates, filters):
+        """Facet value counts among candidates
+
+        Each facet is counted with every filter applied except its own, so
+        selecting "Lahore" still shows how many programs the other cities have.
+        """
+        result = {}
+        for facet in FACETS:
+            skip = "fee" if facet == "fee_range" else facet
+            base = candidates & self.filter_bits(filters, skip=skip)
+            values = []
+            for key, bits in self.postings[facet].items():
+                count = (base & bits).bit_count()
+                if count:
+                    values.append({"value": self.labels[facet][key], "count": count})
+            if facet == "fee_range":
+                # Include the bounds so a client can turn a bucket into fee_min/fee_max
+                buckets = {label: (low, high) for label, low, high in FEE_BUCKETS}
+                for v in values:
+                    v["min"], v["max"] = buckets[v["value"]]
+                order = [label for label, _, _ in FEE_BUCKETS]
+                values.sort(key=lambda v: order.index(v["value"]))
+            else:
+                values.sort(key=lambda v: (-v["count"], v["value"]))
+            result[facet] = values
+        return result
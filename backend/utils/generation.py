@@ -0,0 +1,79 @@
+import threading
+import time
+from datetime import datetime, timezone
+
+from pymongo import ReturnDocument
+
+from config.async_db import get_async_meta_collection
+from config.db import get_meta_collection
+from config.settings import GENERATION_POLL_SECONDS
+
+GENERATION_ID = "data_generation"
+
+_lock = threading.Lock()
+_cached = {"value": 0, "updated_at": None, "source": None}
+_checked_at = 0.0
+
+
+def bump_generation(source=None):
+    """Record that university data changed; call after every scraper write
+
+    Returns the new generation number. Anything cached under an older
+    generation is stale from this point on.
+    """
+    global _checked_at
+    doc = get_meta_collection().find_one_and_update(
+        {"_id": GENERATION_ID},
+        {
+            "$inc": {"value": 1},
+            "$set": {"updated_at": datetime.now(timezone.utc), "source": source}
+        },
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    with _lock:
+        _cached.update(value=doc["value"], updated_at=doc.get("updated_at"), source=doc.get("source"))
+        _checked_at = time.monotonic()
+    return doc["value"]
+
+
+def get_generation_info():
+    """Current generation as {"value", "updated_at", "source"}
+
+    Scrapers run in their own processes, so the counter lives in MongoDB.
+    It is re-read at most every GENERATION_POLL_SECONDS.
+    """
+    now = time.monotonic()
+    with _lock:
+        if _checked_at and now - _checked_at < GENERATION_POLL_SECONDS:
+            return dict(_cached)
+
+    doc = get_meta_collection().find_one({"_id": GENERATION_ID}) or {}
+    return _remember(doc, now)
+
+
+async def get_generation_info_async():
+    """get_generation_info for async handlers, sharing the same poll interval"""
+    now = time.monotonic()
+    with _lock:
+        if _checked_at and now - _checked_at < GENERATION_POLL_SECONDS:
+            return dict(_cached)
+
+    doc = await get_async_meta_collection().find_one({"_id": GENERATION_ID}) or {}
+    return _remember(doc, now)
+
+
+def _remember(doc, checked_at):
+    global _checked_at
+    with _lock:
+        _cached.update(value=doc.get("value", 0), updated_at=doc.get("updated_at"), source=doc.get("source"))
+        _checked_at = checked_at
+        return dict(_cached)
+
+
+def current_generation():
+    return get_generation_info()["value"]
+
+
+async def current_generation_async():
+    return (await get_generation_info_async())["value"]
@@ -0,0 +1,46 @@
+import hashlib
+from email.utils import format_datetime, parsedate_to_datetime
+from datetime import timezone
+
+
+def make_etag(*parts):
+    """Weak ETag over the given bytes/str parts
+
+    Weak because the compression middleware serves gzip, brotli and identity
+    bodies of the same response, and RFC 9110 only allows a strong validator
+    to be shared by identical bytes.
+    """
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode("utf-8"))
+    return f'W/"{digest.hexdigest()}"'
+
+
+def http_date(dt):
+    """Format a datetime for Last-Modified (naive datetimes are taken as UTC)"""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return format_datetime(dt.astimezone(timezone.utc), usegmt=True)
+
+
+def is_not_modified(headers, etag, last_modified=None):
+    """True when the request's validators show the client already has this response
+
+    If-None-Match takes precedence over If-Modified-Since, as RFC 9110 requires,
+    and is compared weakly (a W/ prefix on either side is ignored).
+    """
+    if_none_match = headers.get("if-none-match")
+    if if_none_match:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag.removeprefix("W/") in tags
+
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        return last_modified.replace(microsecond=0) <= since
+    return False
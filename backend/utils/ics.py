@@ -0,0 +1,76 @@
+import hashlib
+from datetime import datetime, timedelta, timezone
+
+# DTSTAMP when the data has no timestamp yet; a fixed value keeps the bytes (and ETag) stable
+DEFAULT_STAMP = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def escape_text(value):
+    """Escape a TEXT value as RFC 5545 requires"""
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold_line(line):
+    """Split a content line into 75-octet chunks joined by CRLF + space"""
+    data = line.encode("utf-8")
+    if len(data) <= 75:
+        return line
+    parts = []
+    while data:
+        limit = 75 if not parts else 74
+        chunk = data[:limit]
+        # Don't cut a multi-byte character in half
+        while chunk and (chunk[-1] & 0xC0) == 0x80 and len(chunk) < len(data):
+            chunk = chunk[:-1]
+        parts.append(chunk.decode("utf-8", errors="ignore"))
+        data = data[len(chunk):]
+    return "\r\n ".join(parts)
+
+
+def render_calendar(name, deadlines, stamp=None):
+    """Render deadlines as an iCalendar file of all-day events
+
+    deadlines are dicts with university_name, title, deadline_iso and
+    optionally url. Returns the file as bytes. Without a stamp, DTSTAMP is
+    DEFAULT_STAMP rather than the render time, so identical data always
+    renders identical bytes.
+    """
+    stamp = stamp or DEFAULT_STAMP
+    if stamp.tzinfo is None:
+        # MongoDB hands back naive datetimes that are already UTC
+        stamp = stamp.replace(tzinfo=timezone.utc)
+    stamp = stamp.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//UniGuide//University Deadlines//EN",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{escape_text(name)}",
+        "X-PUBLISHED-TTL:PT1H",
+    ]
+    for deadline in deadlines:
+        day = datetime.strptime(deadline["deadline_iso"], "%Y-%m-%d")
+        uid_source = f'{deadline["university_name"]}|{deadline["title"]}|{deadline["deadline_iso"]}'
+        uid = hashlib.sha1(uid_source.encode("utf-8")).hexdigest()
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{uid}@universityguide",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART;VALUE=DATE:{day.strftime('%Y%m%d')}",
+            f"DTEND;VALUE=DATE:{(day + timedelta(days=1)).strftime('%Y%m%d')}",
+            f"SUMMARY:{escape_text(deadline['university_name'] + ': ' + deadline['title'])}",
+            f"DESCRIPTION:{escape_text(deadline.get('deadline_date', ''))}",
+        ]
+        if deadline.get("url"):
+            lines.append(f"URL:{deadline['url']}")
+        lines.append("END:VEVENT")
+    lines.append("END:VCALENDAR")
+    return ("\r\n".join(fold_line(line) for line in lines) + "\r\n").encode("utf-8")
@@ -0,0 +1,55 @@
+from utils.deadline_dates import normalize_deadline
+from utils.lookup import lookup_key, lookup_keys
+from utils.summary import compute_summary
+
+# Derived fields that exist for the API's own queries, never returned to clients
+INTERNAL_FIELDS = ("lookup_keys", "city_key", "summary")
+
+
+def to_dict(model):
+    return model.dict() if hasattr(model, "dict") else dict(model)
+
+
+def city_key(university):
+    """Normalized city used for indexed city lookups, or None"""
+    return lookup_key(university["city"]) if university.get("city") else None
+
+
+def prepare_deadline(deadline):
+    """Standalone deadline document ready to insert into the deadlines collection"""
+    return normalize_deadline(to_dict(deadline))
+
+
+def prepare_university(university):
+    """University document ready to insert, with derived fields computed once at ingest"""
+    data = to_dict(university)
+    data["deadlines"] = [normalize_deadline(to_dict(d)) for d in data.get("deadlines", [])]
+    data["lookup_keys"] = lookup_keys(data)
+    data["city_key"] = city_key(data)
+    data["summary"] = compute_summary(data)
+    return data
+
+
+def backfill_deadline_dates(collection):
+    """Add parsed date fields to standalone deadlines stored before they existed"""
+    updated = 0
+    for deadline in collection.find({"deadline_parse_status": {"$exists": False}}, {"deadline_date": 1}):
+        fields = normalize_deadline({"deadline_date": deadline.get("deadline_date")})
+        del fields["deadline_date"]
+        collection.update_one({"_id": deadline["_id"]}, {"$set": fields})
+        updated += 1
+    return updated
+
+
+def backfill_university_fields(collection):
+    """Add lookup_keys, city_key and summary to university documents stored before they existed"""
+    updated = 0
+    query = {"$or": [{field: {"$exists": False}} for field in ("lookup_keys", "city_key", "summary")]}
+    for uni in collection.find(query):
+        collection.update_one({"_id": uni["_id"]}, {"$set": {
+            "lookup_keys": lookup_keys(uni),
+            "city_key": city_key(uni),
+            "summary": compute_summary(uni)
+        }})
+        updated += 1
+    return updated
@@ -0,0 +1,32 @@
+# Other names people use for each university, keyed by the name scrapers store
+UNIVERSITY_ALIASES = {
+    "AU": ["Air University", "Air University Islamabad"],
+    "COMSATS Lahore": ["COMSATS", "CUI Lahore", "CIIT Lahore"],
+    "FAST-NU Lahore": ["FAST", "FAST Lahore", "FAST-NU", "FAST-NUCES", "FAST-NUCES Lahore", "NUCES Lahore"],
+    "GIKI": ["GIK Institute", "Ghulam Ishaq Khan Institute"],
+    "IBA Karachi": ["IBA"],
+    "ITU": ["ITU Lahore", "ITU Punjab"],
+    "LSE": ["Lahore School", "Lahore School of Economics"],
+    "LUMS": ["LUMS Lahore"],
+    "NUST Islamabad": ["NUST"],
+    "PIEAS Islamabad": ["PIEAS"],
+    "PIFD": ["PIFD Lahore"],
+    "PU": ["Punjab University", "PU Lahore", "University of the Punjab"],
+    "UMT": ["UMT Lahore"],
+}
+
+
+def lookup_key(value):
+    """Normalized form used for name lookups: lowercase, single spaces"""
+    return " ".join(str(value).lower().split())
+
+
+def lookup_keys(university):
+    """Every key a university document can be found by"""
+    names = [university.get(field) for field in ("name", "full_name", "shortName", "short_name")]
+    names += UNIVERSITY_ALIASES.get(university.get("name"), [])
+    keys = []
+    for name in names:
+        if name and lookup_key(name) not in keys:
+            keys.append(lookup_key(name))
+    return keys
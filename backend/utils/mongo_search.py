@@ -0,0 +1,128 @@
+import base64
+import re
+
+from pymongo import TEXT
+
+from utils.search_index import tokenize
+
+TEXT_INDEX_NAME = "search_text"
+
+
+TEXT_INDEX_KEYS = [
+    ("name", TEXT),
+    ("full_name", TEXT),
+    ("programs.name", TEXT),
+    ("programs.department", TEXT),
+    ("scholarships.name", TEXT),
+    ("scholarships.type", TEXT),
+]
+
+
+def ensure_text_index(collection):
+    """Create the text index the mongo search backend relies on (no-op if it exists)
+
+    default_language "none" keeps stopwords, so abbreviations like "it"
+    and "me" stay searchable. An index built with other options is replaced.
+    """
+    existing = collection.index_information().get(TEXT_INDEX_NAME)
+    if existing and existing.get("default_language") != "none":
+        collection.drop_index(TEXT_INDEX_NAME)
+    collection.create_index(TEXT_INDEX_KEYS, name=TEXT_INDEX_NAME, default_language="none")
+
+
+def encode_offset(offset):
+    return base64.urlsafe_b64encode(str(offset).encode()).decode().rstrip("=")
+
+
+def decode_offset(cursor):
+    """Inverse of encode_offset; raises ValueError for malformed cursors"""
+    try:
+        offset = int(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if offset < 0:
+        raise ValueError("Invalid cursor")
+    return offset
+
+
+def all_tokens_match(fields, tokens):
+    """Match expression requiring every token to appear in at least one of fields"""
+    return {"$and": [
+        {"$or": [{field: {"$regex": re.escape(token), "$options": "i"}} for field in fields]}
+        for token in tokens
+    ]}
+
+
+async def search_embedded(collection, query, tokens, array, fields, project, offset, limit):
+    """Return matching sub-documents of one embedded array, a page at a time
+
+    The $text stage selects candidate universities through the text index.
+    Only their matching array entries are unwound, filtered and projected,
+    so only the hits come back over the wire. Hits are sorted by text score,
+    document and array position, so offset pages neither skip nor repeat.
+    """
+    pipeline = [
+        {"$match": {"$text": {"$search": query}}},
+        {"$project": {"name": 1, array: 1, "score": {"$meta": "textScore"}}},
+        {"$unwind": {"path": f"${array}", "includeArrayIndex": "position"}},
+        {"$match": all_tokens_match([f"{array}.{field}" for field in fields], tokens)},
+        {"$sort": {"score": -1, "_id": 1, "position": 1}},
+        {"$skip": offset},
+        {"$limit": limit + 1},
+        {"$project": dict({"_id": 0, "university": "$name"}, **project)},
+    ]
+    return await (await collection.aggregate(pipeline)).to_list()
+
+
+async def mongo_search(collection, query, limits, cursors=None):
+    """Search universities, programs and scholarships inside MongoDB
+
+    collection is an AsyncMongoClient collection. Same response shape as
+    SearchIndex.search. Text search matches whole, unstemmed words, so
+    partial words like "comp" do not match here.
+    """
+    cursors = cursors or {}
+    tokens = list(dict.fromkeys(tokenize(query)))
+    results = {"universities": [], "programs": [], "scholarships": []}
+    next_cursors = {key: None for key in results}
+    if not tokens:
+        results["cursors"] = next_cursors
+        return results
+
+    offsets = {key: decode_offset(cursors[key]) if cursors.get(key) else 0 for key in results}
+
+    def page(key, hits):
+        limit = limits.get(key, 10)
+        if len(hits) > limit:
+            next_cursors[key] = encode_offset(offsets[key] + limit)
+        return hits[:limit]
+
+    if limits.get("universities", 10) > 0:
+        hits = await collection.find(
+            {"$and": [
+                {"$text": {"$search": query}},
+                all_tokens_match(["name", "full_name"], tokens),
+            ]},
+            {"_id": 0, "name": 1, "full_name": 1, "city": 1, "score": {"$meta": "textScore"}},
+        ).sort([("score", {"$meta": "textScore"}), ("_id", 1)]).skip(offsets["universities"]).limit(limits.get("universities", 10) + 1).to_list()
+        results["universities"] = page("universities", [dict(uni, type="university") for uni in hits])
+
+    if limits.get("programs", 10) > 0:
+        hits = await search_embedded(collection, query, tokens, "programs", ["name", "department"], {
+            "name": "$programs.name",
+            "department": "$programs.department",
+            "fee": "$programs.total_fee_first_year",
+            "eligibility": "$programs.eligibility",
+        }, offsets["programs"], limits.get("programs", 10))
+        results["programs"] = page("programs", [dict(p, type="program") for p in hits])
+
+    if limits.get("scholarships", 10) > 0:
+        hits = await search_embedded(collection, query, tokens, "scholarships", ["name", "type"], {
+            "name": "$scholarships.name",
+            "type": "$scholarships.type",
+            "link": "$scholarships.link",
+        }, offsets["scholarships"], limits.get("scholarships", 10))
+        results["scholarships"] = page("scholarships", [dict(s, type_label="scholarship") for s in hits])
+
+    results["cursors"] = next_cursors
+    return results
@@ -0,0 +1,335 @@
+import base64
+import heapq
+import json
+import math
+import re
+import threading
+from bisect import bisect_left
+
+from utils.facets import FacetIndex, iter_bits
+from utils.synonyms import expand_synonyms
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# BM25 tuning constants
+K1 = 1.2
+B = 0.75
+
+# Default trigram similarity a fuzzy term must reach to count as a match
+FUZZY_THRESHOLD = 0.3
+
+
+def tokenize(text):
+    """Lowercase text and split it into alphanumeric tokens"""
+    if not text:
+        return []
+    return TOKEN_RE.findall(str(text).lower())
+
+
+def encode_cursor(generation, score, item_id):
+    """Opaque cursor pointing just past (score, item_id) in the index built from a data generation"""
+    raw = json.dumps([generation, score, item_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    """Inverse of encode_cursor; raises ValueError for malformed cursors"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        generation, score, item_id = json.loads(raw)
+        return int(generation), float(score), int(item_id)
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+
+def trigrams(word):
+    """Character trigrams of a word, padded so short words and word edges still count"""
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class CategoryIndex:
+    """Inverted index over one result category (universities, programs or scholarships)"""
+
+    def __init__(self):
+        self.items = []
+        self.lengths = []
+        self.postings = {}
+        self.vocab = []
+        self.vocab_trigrams = []
+        self.trigram_postings = {}
+        self.avg_length = 0
+
+    def add(self, item, texts):
+        item_id = len(self.items)
+        tokens = []
+        for text in texts:
+            tokens.extend(tokenize(text))
+
+        self.items.append(item)
+        self.lengths.append(len(tokens))
+
+        # Synonyms are compiled in here so queries never need expanding;
+        # they don't count towards the length used for BM25 normalization
+        tokens.extend(expand_synonyms(tokens))
+
+        for token in tokens:
+            postings = self.postings.setdefault(token, {})
+            postings[item_id] = postings.get(item_id, 0) + 1
+
+    def finalize(self):
+        self.vocab = sorted(self.postings)
+        self.avg_length = (sum(self.lengths) / len(self.lengths)) if self.lengths else 0
+
+        # Trigram -> vocabulary positions, used by fuzzy matching
+        self.vocab_trigrams = []
+        self.trigram_postings = {}
+        for term_id, term in enumerate(self.vocab):
+            grams = trigrams(term)
+            self.vocab_trigrams.append(len(grams))
+            for gram in grams:
+                self.trigram_postings.setdefault(gram, []).append(term_id)
+
+    def expand(self, token):
+        """All indexed terms starting with token, found by binary search on the vocabulary"""
+        terms = {}
+        i = bisect_left(self.vocab, token)
+        while i < len(self.vocab) and self.vocab[i].startswith(token):
+            term = self.vocab[i]
+            # Exact term matches outrank prefix matches of the same token
+            terms[term] = 1.0 if term == token else 0.8
+            i += 1
+        return terms
+
+    def fuzzy_expand(self, token, threshold):
+        """Indexed terms whose trigram similarity to token is at least threshold"""
+        grams = trigrams(token)
+        shared = {}
+        for gram in grams:
+            for term_id in self.trigram_postings.get(gram, ()):
+                shared[term_id] = shared.get(term_id, 0) + 1
+
+        terms = {}
+        for term_id, count in shared.items():
+            similarity = count / (len(grams) + self.vocab_trigrams[term_id] - count)
+            if similarity >= threshold:
+                terms[self.vocab[term_id]] = similarity
+        return terms
+
+    def idf(self, term):
+        n = len(self.items)
+        df = len(self.postings.get(term, ()))
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def match(self, tokens, fuzzy=False, threshold=FUZZY_THRESHOLD):
+        """Return {item_id: score} for items matching every query token
+
+        A token matches terms it is a prefix of; in fuzzy mode it also matches
+        terms with enough trigram overlap, weighted by their similarity.
+        """
+        per_token = []
+        for token in tokens:
+            terms = self.expand(token)
+            if fuzzy:
+                for term, similarity in self.fuzzy_expand(token, threshold).items():
+                    if similarity > terms.get(term, 0):
+                        terms[term] = similarity
+
+            hits = {}
+            for term, weight in terms.items():
+                idf = self.idf(term)
+                for item_id, tf in self.postings[term].items():
+                    length_norm = 1 - B + B * (self.lengths[item_id] / self.avg_length if self.avg_length else 0)
+                    score = weight * idf * (tf * (K1 + 1)) / (tf + K1 * length_norm)
+                    if score > hits.get(item_id, 0):
+                        hits[item_id] = score
+            if not hits:
+                return {}
+            per_token.append(hits)
+
+        # Intersect starting from the rarest token
+        per_token.sort(key=len)
+        scores = dict(per_token[0])
+        for hits in per_token[1:]:
+            scores = {i: s + hits[i] for i, s in scores.items() if i in hits}
+            if not scores:
+                break
+        return scores
+
+    def search(self, tokens, limit, fuzzy=False, threshold=FUZZY_THRESHOLD, after=None):
+        """Return one page of ranked hits and the (score, item_id) of the last hit, if more remain
+
+        Results are ordered by score, then index position, so a page boundary is
+        a stable key. Only limit + 1 hits are kept while ranking, and only the
+        returned page is materialized.
+        """
+        scores = self.match(tokens, fuzzy, threshold)
+        candidates = scores.items()
+        if after is not None:
+            after_key = (-after[0], after[1])
+            candidates = [(i, s) for i, s in candidates if (-s, i) > after_key]
+
+        top = heapq.nsmallest(limit + 1, candidates, key=lambda x: (-x[1], x[0]))
+        page = top[:limit]
+        next_after = None
+        if len(top) > limit:
+            item_id, score = page[-1]
+            next_after = (score, item_id)
+        return [dict(self.items[item_id], score=round(score, 4)) for item_id, score in page], next_after
+
+
+class SearchIndex:
+    """BM25 search index over universities, programs and scholarships"""
+
+    def __init__(self):
+        self.universities = CategoryIndex()
+        self.programs = CategoryIndex()
+        self.scholarships = CategoryIndex()
+        self.program_facets = FacetIndex()
+        self.built = False
+        self.generation = None
+        self.lock = threading.Lock()
+
+    def build(self, documents, generation=0):
+        """Build a fresh index from university documents and swap it in
+
+        generation is the data generation the documents were read at. Cursors
+        carry it rather than a per-process counter, so they stay valid across
+        restarts and across workers that built from the same data.
+        """
+        universities = CategoryIndex()
+        programs = CategoryIndex()
+        scholarships = CategoryIndex()
+        program_facets = FacetIndex()
+
+        for uni in documents:
+            uni_name = uni.get("name", "")
+            uni_full = uni.get("full_name", "")
+
+            universities.add({
+                "name": uni_name,
+                "full_name": uni_full,
+                "city": uni.get("city"),
+                "type": "university"
+            }, [uni_name, uni_full])
+
+            for program in uni.get("programs", []):
+                prog_name = program.get("name", "")
+                prog_dept = program.get("department", "")
+                program_facets.add(len(programs.items), {
+                    "city": uni.get("city"),
+                    "department": prog_dept,
+                    "entry_test": (program.get("eligibility") or {}).get("entry_test")
+                }, program.get("total_fee_first_year"))
+                programs.add({
+                    "name": prog_name,
+                    "department": prog_dept,
+                    "university": uni_name,
+                    "city": uni.get("city"),
+                    "fee": program.get("total_fee_first_year"),
+                    "eligibility": program.get("eligibility", {}),
+                    "type": "program"
+                }, [prog_name, prog_dept])
+
+            for scholarship in uni.get("scholarships", []):
+                scholar_name = scholarship.get("name", "")
+                scholar_type = scholarship.get("type", "")
+                scholarships.add({
+                    "name": scholar_name,
+                    "type": scholar_type,
+                    "university": uni_name,
+                    "link": scholarship.get("link", ""),
+                    "type_label": "scholarship"
+                }, [scholar_name, scholar_type])
+
+        for category in (universities, programs, scholarships, program_facets):
+            category.finalize()
+
+        with self.lock:
+            self.universities = universities
+            self.programs = programs
+            self.scholarships = scholarships
+            self.program_facets = program_facets
+            self.built = True
+            self.generation = generation
+
+    def search(self, query, limits, fuzzy=False, threshold=FUZZY_THRESHOLD, cursors=None):
+        """Search every category
+
+        limits maps category name to page size and cursors maps category name
+        to the cursor returned by a previous page. A cursor from another data
+        generation raises ValueError, since positions change with the data.
+        """
+        cursors = cursors or {}
+        tokens = list(dict.fromkeys(tokenize(query)))
+        results = {"universities": [], "programs": [], "scholarships": []}
+        next_cursors = {key: None for key in results}
+
+        with self.lock:
+            generation = self.generation
+            categories = {
+                "universities": self.universities,
+                "programs": self.programs,
+                "scholarships": self.scholarships,
+            }
+
+        for key, category in categories.items():
+            after = None
+            if cursors.get(key):
+                cursor_generation, score, item_id = decode_cursor(cursors[key])
+                if cursor_generation != generation:
+                    raise ValueError("Cursor has expired, data was refreshed")
+                after = (score, item_id)
+
+            limit = limits.get(key, 10)
+            if not tokens or limit <= 0:
+                continue
+            hits, next_after = category.search(tokens, limit, fuzzy, threshold, after)
+            results[key] = hits
+            if next_after:
+                next_cursors[key] = encode_cursor(generation, *next_after)
+
+        results["cursors"] = next_cursors
+        return results
+
+    def search_programs(self, query, filters, limit, offset=0):
+        """Filter programs by facets, optionally matching query, and count facet values
+
+        filters maps "city", "department" and "entry_test" to a value and
+        "fee" to a (fee_min, fee_max) tuple; None means no filter. Without a
+        query, hits keep index order and collection stops once the page is full.
+        """
+        with self.lock:
+            programs = self.programs
+            facets = self.program_facets
+
+        tokens = list(dict.fromkeys(tokenize(query)))
+        scores = None
+        candidates = facets.all_bits
+        if tokens:
+            scores = programs.match(tokens)
+            candidates = 0
+            for item_id in scores:
+                candidates |= 1 << item_id
+
+        matched = candidates & facets.filter_bits(filters)
+        if scores is None:
+            page = []
+            for item_id in iter_bits(matched):
+                if len(page) == offset + limit:
+                    break
+                page.append(item_id)
+            page = page[offset:]
+        else:
+            ranked = heapq.nsmallest(
+                offset + limit,
+                ((item_id, scores[item_id]) for item_id in iter_bits(matched)),
+                key=lambda x: (-x[1], x[0])
+            )
+            page = [item_id for item_id, _ in ranked[offset:]]
+
+        return {
+            "total": matched.bit_count(),
+            "programs": [dict(programs.items[item_id]) for item_id in page],
+            "facets": facets.counts(candidates, filters)
+        }
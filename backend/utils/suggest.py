@@ -0,0 +1,88 @@
+import threading
+
+from utils.search_index import tokenize
+
+# Completions kept at every trie node, and so the most /api/suggest can return
+MAX_SUGGESTIONS = 10
+
+
+def normalize(text):
+    return " ".join(tokenize(text))
+
+
+class SuggestIndex:
+    """Prefix trie of university, program and department names
+
+    Every node keeps its top completions by popularity, so a lookup walks
+    the prefix and returns that list without visiting the subtree. Phrases
+    are also indexed from each word start, so "sci" completes "Computer Science".
+    """
+
+    def __init__(self):
+        self.root = {}
+        self.entries = []
+        self.built = False
+        self.lock = threading.Lock()
+
+    def build(self, documents):
+        weights = {}
+
+        def count(kind, text, extra=None, amount=1):
+            key = (kind, normalize(text))
+            if not key[1]:
+                return
+            if key not in weights:
+                weights[key] = {"text": text.strip(), "type": kind, "count": 0}
+                if extra:
+                    weights[key].update(extra)
+            weights[key]["count"] += amount
+
+        for uni in documents:
+            uni_name = uni.get("name", "")
+            programs = uni.get("programs", [])
+            # A university's popularity is the number of programs it offers
+            for field in ("name", "full_name", "shortName", "short_name"):
+                if uni.get(field):
+                    count("university", uni[field], {"university": uni_name}, len(programs) + 1)
+            for program in programs:
+                count("program", program.get("name", ""))
+                count("department", program.get("department", ""))
+
+        entries = list(weights.values())
+        root = {}
+        for entry_id, entry in enumerate(entries):
+            words = normalize(entry["text"]).split()
+            for start in range(len(words)):
+                self._insert(root, entries, " ".join(words[start:]), entry_id)
+
+        with self.lock:
+            self.root = root
+            self.entries = entries
+            self.built = True
+
+    @staticmethod
+    def _insert(root, entries, key, entry_id):
+        node = root
+        for char in key:
+            node = node.setdefault(char, {"": []})
+            top = node[""]
+            if entry_id in top:
+                continue
+            top.append(entry_id)
+            top.sort(key=lambda i: (-entries[i]["count"], entries[i]["text"]))
+            del top[MAX_SUGGESTIONS:]
+
+    def suggest(self, prefix, limit=MAX_SUGGESTIONS):
+        key = normalize(prefix)
+        if not key:
+            return []
+
+        with self.lock:
+            node = self.root
+            entries = self.entries
+
+        for char in key:
+            node = node.get(char)
+            if node is None:
+                return []
+        return [dict(entries[i]) for i in node[""][:limit]]
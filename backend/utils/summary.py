@@ -0,0 +1,61 @@
+from statistics import median
+
+from utils.deadline_dates import normalize_deadline
+
+
+def fee_stats(programs):
+    fees = [p.get("total_fee_first_year") for p in programs if p.get("total_fee_first_year")]
+    if not fees:
+        return {"min": 0, "max": 0, "avg": 0, "median": 0}
+    return {
+        "min": min(fees),
+        "max": max(fees),
+        "avg": round(sum(fees) / len(fees)),
+        "median": round(median(fees))
+    }
+
+
+def departments(programs):
+    depts = set()
+    for p in programs:
+        dept = (p.get("department") or "").strip()
+        if dept:
+            depts.add(dept)
+    return sorted(depts)
+
+
+def compute_summary(uni):
+    """Small per-university digest stored with the document at ingest
+
+    Holds what the compare and city views need, so they never have to
+    load the programs, scholarships and deadlines arrays.
+    """
+    programs = uni.get("programs") or []
+    deadlines = [
+        d if "deadline_parse_status" in d else normalize_deadline(dict(d))
+        for d in uni.get("deadlines") or []
+    ]
+    schedule = sorted(
+        ({"title": d.get("title", ""), "date": d["deadline_iso"]} for d in deadlines if d.get("deadline_iso")),
+        key=lambda d: d["date"]
+    )
+    return {
+        "fee_range": fee_stats(programs),
+        "departments": departments(programs),
+        "program_count": len(programs),
+        "scholarship_count": len(uni.get("scholarships") or []),
+        "deadline_count": len(deadlines),
+        "deadline_schedule": schedule
+    }
+
+
+def summary_of(uni):
+    return uni.get("summary") or compute_summary(uni)
+
+
+def next_deadline(summary, today):
+    """First scheduled deadline on or after today (YYYY-MM-DD), or None"""
+    for deadline in summary.get("deadline_schedule", []):
+        if deadline["date"] >= today:
+            return deadline
+    return None
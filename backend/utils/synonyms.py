@@ -0,0 +1,85 @@
+# Abbreviations and the phrases they stand for. Every entry in a group is
+# treated as equivalent: an item containing one of them is also indexed
+# under the words of the others, so "cs" finds "Computer Science" programs
+# and "computer science" finds a program listed as "BSCS". Phrases must be
+# specific: a generic one like "business administration" would also tag
+# every MBA as a BBA.
+SYNONYM_GROUPS = [
+    ["cs", "computer science"],
+    ["bscs", "bs computer science"],
+    ["it", "information technology"],
+    ["bsit", "bs information technology"],
+    ["se", "software engineering"],
+    ["bsse", "bs software engineering"],
+    ["ee", "electrical engineering"],
+    ["bsee", "bs electrical engineering"],
+    ["me", "mechanical engineering"],
+    ["ce", "civil engineering"],
+    ["ai", "artificial intelligence"],
+    ["bsai", "bs artificial intelligence"],
+    ["ds", "data science"],
+    ["bsds", "bs data science"],
+    ["bba", "bachelor of business administration"],
+    ["mba", "master of business administration"],
+    ["mbbs", "bachelor of medicine and bachelor of surgery"],
+    ["bds", "bachelor of dental surgery", "dentistry"],
+    ["llb", "bachelor of laws"],
+    ["pharmd", "pharm d", "doctor of pharmacy"],
+]
+
+# Abbreviations that are also everyday words. They are added when their
+# phrase occurs but never expanded themselves, so a description containing
+# "it" is not indexed as "information technology".
+ONE_WAY = {"it", "me"}
+
+# Filler words not worth indexing as synonyms (one-letter words are skipped too)
+STOPWORDS = {"of", "and", "the", "in", "for"}
+
+
+def _compile(groups):
+    """Map each phrase's first word to (phrase words, words to add when it occurs)"""
+    table = {}
+    for group in groups:
+        phrases = [tuple(phrase.split()) for phrase in group]
+        for phrase in phrases:
+            if " ".join(phrase) in ONE_WAY:
+                continue
+            extra = []
+            for other in phrases:
+                if other != phrase:
+                    extra.extend(
+                        word for word in other
+                        if word not in extra and word not in STOPWORDS and len(word) > 1
+                    )
+            table.setdefault(phrase[0], []).append((phrase, extra))
+    return table
+
+
+SYNONYM_TABLE = _compile(SYNONYM_GROUPS)
+
+
+def _phrase_matches(tokens):
+    words = []
+    for i, token in enumerate(tokens):
+        for phrase, extra in SYNONYM_TABLE.get(token, ()):
+            if tuple(tokens[i:i + len(phrase)]) == phrase:
+                words.extend(extra)
+    return words
+
+
+def expand_synonyms(tokens):
+    """Extra tokens to index alongside tokens, for every synonym phrase found in them
+
+    Expansions are expanded again, so "bscs" -> "bs computer science" -> "cs".
+    """
+    seen = set(tokens)
+    extra = []
+    pending = tokens
+    while pending:
+        new_words = [word for word in _phrase_matches(pending) if word not in seen]
+        new_words = list(dict.fromkeys(new_words))
+        seen.update(new_words)
+        extra.extend(new_words)
+        pending = new_words
+    return extra
+
@@ -0,0 +1,108 @@
+import threading
+
+from utils.cache import ResultCache
+from utils.ingest import INTERNAL_FIELDS
+from utils.lookup import lookup_key, lookup_keys
+
+
+def decode(uni):
+    """Make a university document JSON-ready once, before it is shared from the cache"""
+    uni = {key: value for key, value in uni.items() if key not in INTERNAL_FIELDS}
+    if "_id" in uni:
+        uni["_id"] = str(uni["_id"])
+    return uni
+
+
+def project_document(doc, fields):
+    """Apply a MongoDB-style inclusion projection ("name", "programs.name", ...) in Python"""
+    tree = {}
+    for field in fields:
+        node = tree
+        for part in field.split("."):
+            node = node.setdefault(part, {})
+
+    def apply(value, node):
+        if not node:
+            return value
+        if isinstance(value, list):
+            return [apply(item, node) for item in value if isinstance(item, dict)]
+        if isinstance(value, dict):
+            return {key: apply(value[key], child) for key, child in node.items() if key in value}
+        return None
+
+    result = {key: apply(doc[key], child) for key, child in tree.items() if key in doc}
+    if "_id" in doc and "_id" not in result:
+        result["_id"] = doc["_id"]
+    return result
+
+
+class UniversityCache:
+    """Read-through cache of decoded university documents, keyed by lookup key
+
+    Entries belong to a data generation, so new scraper data is never served
+    stale. A warmed cache also holds the full list of universities, which
+    lets whole-collection reads skip MongoDB.
+    """
+
+    def __init__(self, maxsize=512):
+        self.cache = ResultCache(maxsize=maxsize, ttl=0)
+        self.lock = threading.Lock()
+        self.warm_generation = None
+        self.documents = []
+
+    @property
+    def enabled(self):
+        return self.cache.maxsize > 0
+
+    def store(self, generation, uni):
+        for key in uni.get("lookup_keys") or lookup_keys(uni):
+            self.cache.set(generation, key, uni)
+
+    async def get(self, generation, name, load):
+        """Return the university for name, awaiting load(query) on a miss"""
+        key = lookup_key(name)
+        uni = self.cache.get(generation, key)
+        if uni is None:
+            uni = await load({"lookup_keys": key})
+            if uni is None:
+                return None
+            uni = decode(uni)
+            self.store(generation, uni)
+        return uni
+
+    async def get_many(self, generation, names, load_many):
+        """{lookup key: university} for names, loading every miss with one awaited load_many(query)"""
+        found = {}
+        missing = []
+        for key in dict.fromkeys(lookup_key(name) for name in names):
+            uni = self.cache.get(generation, key)
+            if uni is None:
+                missing.append(key)
+            else:
+                found[key] = uni
+        if missing:
+            for uni in await load_many({"lookup_keys": {"$in": missing}}):
+                uni = decode(uni)
+                self.store(generation, uni)
+                for key in uni.get("lookup_keys") or lookup_keys(uni):
+                    if key in missing:
+                        found[key] = uni
+        return found
+
+    def warm(self, generation, documents):
+        documents = [decode(uni) for uni in documents]
+        for uni in documents:
+            self.store(generation, uni)
+        with self.lock:
+            self.documents = documents
+            self.warm_generation = generation
+
+    def all(self, generation):
+        """Every university if the cache was warmed for this generation, else None"""
+        with self.lock:
+            if self.warm_generation == generation:
+                return self.documents
+        return None
+
+    def stats(self):
+        return dict(self.cache.stats(), warm_generation=self.warm_generation)
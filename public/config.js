@@ -1,7 +1,44 @@
 const CONFIG = {
-    API_URL: 'https://universityguide.onrender.com'
+    API_URL: 'https://universityguide.onrender.com',
+    // Static JSON snapshot written by backend/api/export_snapshot.py
+    SNAPSHOT_URL: '/data'
 };
 
+let snapshotManifest = null;
+
+// The snapshot manifest, or {} when it is missing or older than the API's data
+function loadSnapshotManifest() {
+    const manifest = fetch(`${CONFIG.SNAPSHOT_URL}/manifest.json`)
+        .then(res => res.ok ? res.json() : {});
+    const generation = fetch(`${CONFIG.API_URL}/api/generation`)
+        .then(res => res.ok ? res.json() : null)
+        .catch(() => null);
+    return Promise.all([manifest, generation]).then(([manifest, current]) => {
+        // Scrapes after the export bump the generation; fall back to the live API then
+        if (current && !(manifest.generation >= current.value)) return {};
+        return manifest;
+    });
+}
+
+// Load a dataset from the static snapshot, falling back to the API when there is none
+async function loadData(snapshotKey, apiPath) {
+    try {
+        if (!snapshotManifest) {
+            snapshotManifest = loadSnapshotManifest();
+        }
+        const file = ((await snapshotManifest).files || {})[snapshotKey];
+        if (file) {
+            const res = await fetch(`${CONFIG.SNAPSHOT_URL}/${file}`);
+            if (res.ok) return await res.json();
+        }
+    } catch (err) {
+        console.warn('Snapshot unavailable, using the API:', err);
+    }
+    const res = await fetch(`${CONFIG.API_URL}${apiPath}`);
+    if (!res.ok) throw new Error(`Failed to load ${apiPath}`);
+    return await res.json();
+}
+
 if (typeof module !== 'undefined' && module.exports) {
     module.exports = CONFIG;
-}
\ No newline at end of file
+}